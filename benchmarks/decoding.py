@@ -0,0 +1,53 @@
+"""Times each installed JSON backend (see ``atto_weather.api.decoding``) on a 14-day
+forecast and a search response, decoding alone and followed by parsing.
+
+    python benchmarks/decoding.py
+"""
+
+from __future__ import annotations
+
+import logging
+import platform
+import timeit
+from typing import Any, Callable
+
+from payloads import encode, forecast_payload, search_payload
+
+from atto_weather.api import decoding
+from atto_weather.api.core import WeatherInfo
+
+
+def best_of(func: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """Returns the best time of a single call, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    # a backend that is not installed is only reported as missing
+    logging.disable(logging.WARNING)
+
+    forecast = encode(forecast_payload())
+    search = encode(search_payload())
+
+    print(f"Python {platform.python_version()}, best of 5")
+    print(f"forecast.json {len(forecast) / 1024:.0f} KiB, search.json {len(search)} B\n")
+    print(f"{'':10}{'forecast':>12}{'search':>12}{'decode+parse':>16}")
+
+    for name in decoding.PREFERRED_BACKENDS:
+        if decoding.set_backend(name) != name:
+            print(f"{name:10}{'not installed':>12}")
+            continue
+
+        decode = decoding.decode_json
+        forecast_time = best_of(lambda: decode(forecast), 50)
+        search_time = best_of(lambda: decode(search), 5000)
+        parse_time = best_of(lambda: WeatherInfo.from_dict(decode(forecast)), 50)
+
+        print(
+            f"{name:10}{forecast_time * 1e3:>9.2f} ms{search_time * 1e6:>9.1f} us"
+            f"{parse_time * 1e3:>13.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compares loading each language from its TOML file against loading its compiled
+catalog (see ``atto_weather.i18n.load_catalog``).
+
+    python benchmarks/languages.py
+"""
+
+from __future__ import annotations
+
+import platform
+import subprocess
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+from atto_weather import i18n
+
+
+def best_of(func: Callable[[], Any], number: int, repeat: int = 7) -> float:
+    """Returns the best time of a single call, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def import_time(module: str) -> float:
+    """Returns how long importing ``module`` takes in a new interpreter, in seconds."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True)
+    return float(output.stdout)
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}, best of 7 x 200\n")
+    print(f"{'':12}{'TOML':>12}{'compiled':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # keeps the catalogs of the app untouched
+        i18n.COMPILED_LANG_PATH = Path(directory)
+
+        for path in sorted(i18n.LANG_PATH.glob("*.toml")):
+            lang = path.stem
+            i18n.load_catalog(lang)  # compiles the catalog
+
+            toml_time = best_of(lambda: i18n.flatten_language(i18n.load_language(lang)), 200)
+            compiled_time = best_of(lambda: i18n.load_catalog(lang), 200)
+
+            print(f"{path.name:12}{toml_time * 1e6:>9.0f} us{compiled_time * 1e6:>9.0f} us")
+
+    print(f"\nimport tomli (only when a catalog is compiled): {import_time('tomli') * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
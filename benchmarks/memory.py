@@ -0,0 +1,98 @@
+"""Measures with tracemalloc the memory held by weather data kept resident, as the
+app does for every saved location.
+
+    python benchmarks/memory.py
+"""
+
+from __future__ import annotations
+
+import gc
+import platform
+import tracemalloc
+from typing import Callable
+
+from payloads import encode, forecast_payload
+
+from atto_weather.api.core import WeatherInfo
+from atto_weather.api.decoding import decode_json
+from atto_weather.api.snapshot import dump_snapshot, load_snapshot
+
+LOCATIONS = 20
+
+
+def parse_every_hour(info: WeatherInfo) -> WeatherInfo:
+    for forecast in info.forecasts:
+        list(forecast.hours)
+
+    return info
+
+
+def count_conditions(info: WeatherInfo) -> set[int]:
+    """Returns the ids of the conditions ``info`` refers to."""
+    conditions = {id(info.current.condition)}
+    for forecast in info.forecasts:
+        conditions.add(id(forecast.day.condition))
+        conditions.update(id(hour.condition) for hour in forecast.hours)
+
+    return conditions
+
+
+def resident_size(load: Callable[[bytes], WeatherInfo], responses: list[bytes]) -> float:
+    """Returns the memory held by each of the loaded ``responses``, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        infos = [load(response) for response in responses]
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del infos
+    return size / len(responses)
+
+
+def main() -> None:
+    # a seed per location, so that they do not share their values
+    responses = [encode(forecast_payload(seed=seed)) for seed in range(LOCATIONS)]
+
+    # copied when loaded, a restored snapshot keeps the buffer read from the cache
+    snapshots = [
+        bytearray(dump_snapshot(WeatherInfo.from_dict(decode_json(response))))
+        for response in responses
+    ]
+
+    rows: list[tuple[str, Callable[[bytes], WeatherInfo], list[bytes]]] = [
+        (
+            "decoded, hours unparsed",
+            lambda content: WeatherInfo.from_dict(decode_json(content)),
+            responses,
+        ),
+        (
+            "decoded, every hour parsed",
+            lambda content: parse_every_hour(WeatherInfo.from_dict(decode_json(content))),
+            responses,
+        ),
+        (
+            "restored from snapshots, every hour",
+            lambda snapshot: parse_every_hour(load_snapshot(bytes(snapshot))),
+            snapshots,
+        ),
+    ]
+
+    print(f"Python {platform.python_version()}, {LOCATIONS} 14-day locations kept resident\n")
+    for label, load, inputs in rows:
+        print(f"{label:36}{resident_size(load, inputs) / 1024:>6.0f} KiB per location")
+
+    conditions: set[int] = set()
+    hours = 0
+    for snapshot in snapshots:
+        info = parse_every_hour(load_snapshot(bytes(snapshot)))
+        conditions |= count_conditions(info)
+        hours += sum(len(forecast.hours) for forecast in info.forecasts)
+
+    print(f"\n{len(conditions)} Condition objects for the {hours} hours of every location")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Times building the models from decoded responses: a 14-day forecast, with and
+without parsing every hour, and an offline gazetteer of 50k search results.
+
+    python benchmarks/parsing.py
+"""
+
+from __future__ import annotations
+
+import copy
+import platform
+import timeit
+from typing import Any, Callable
+
+from payloads import forecast_payload, search_payload
+
+from atto_weather.api.core import WeatherInfo
+from atto_weather.api.gazetteer import Gazetteer
+
+
+def best_of(func: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """Returns the best time of a single call, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def parse_every_hour(data: dict[str, Any]) -> WeatherInfo:
+    info = WeatherInfo.from_dict(data)
+    for forecast in info.forecasts:
+        list(forecast.hours)
+
+    return info
+
+
+def main() -> None:
+    forecast = forecast_payload()
+    search = search_payload(50_000)
+
+    # parsing must leave the decoded response as it was, or repeated runs would differ
+    original = copy.deepcopy(forecast)
+    parse_every_hour(forecast)
+    assert forecast == original
+
+    rows: list[tuple[str, Callable[[], Any], int]] = [
+        ("WeatherInfo.from_dict", lambda: WeatherInfo.from_dict(forecast), 200),
+        ("  and every hour", lambda: parse_every_hour(forecast), 50),
+        ("Gazetteer of 50k results", lambda: Gazetteer.from_list(search), 1),
+    ]
+
+    print(f"Python {platform.python_version()}, best of 5\n")
+    for label, func, number in rows:
+        print(f"{label:28}{best_of(func, number) * 1e3:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Synthetic API responses for the benchmarks.
+
+The payloads have the shape and size of real ``forecast.json`` and ``search.json``
+responses, but every value is generated from a fixed seed, so they contain no real
+location or API key and produce the same bytes on every run.
+
+Run it directly to write them to ``forecast.json`` and ``search.json``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import Any
+
+CONDITIONS = [
+    (1000, "Sunny"),
+    (1003, "Partly cloudy"),
+    (1009, "Overcast"),
+    (1063, "Patchy rain nearby"),
+    (1183, "Light rain"),
+    (1195, "Heavy rain"),
+]
+DIRECTIONS = "N NNE NE ENE E ESE SE SSE S SSW SW WSW W WNW NW NNW".split()
+
+START_EPOCH = 1_792_000_000
+"""A local midnight, 2026-10-17 00:00."""
+
+
+def _condition(rng: random.Random, is_day: bool = True) -> dict[str, Any]:
+    code, text = rng.choice(CONDITIONS)
+    icon = 113 + CONDITIONS.index((code, text)) * 3
+    period = "day" if is_day else "night"
+    icon_url = f"//cdn.weatherapi.com/weather/64x64/{period}/{icon}.png"
+
+    return {"text": text, "icon": icon_url, "code": code}
+
+
+def _weather(rng: random.Random, is_day: bool) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+
+    for key in ("temp", "feelslike", "windchill", "heatindex", "dewpoint"):
+        celsius = round(rng.uniform(-5, 35), 1)
+        data[f"{key}_c"] = celsius
+        data[f"{key}_f"] = round(celsius * 1.8 + 32, 1)
+
+    wind_kph = round(rng.uniform(0, 30), 1)
+    gust_kph = round(wind_kph * rng.uniform(1, 1.8), 1)
+    precip_mm = round(rng.choice([0.0, 0.0, 0.0, rng.uniform(0, 5)]), 2)
+
+    data.update(
+        is_day=int(is_day),
+        condition=_condition(rng, is_day),
+        wind_mph=round(wind_kph / 1.609, 1),
+        wind_kph=wind_kph,
+        wind_degree=rng.randint(0, 359),
+        wind_dir=rng.choice(DIRECTIONS),
+        pressure_mb=float(rng.randint(1000, 1030)),
+        pressure_in=29.88,
+        precip_mm=precip_mm,
+        precip_in=round(precip_mm / 25.4, 2),
+        humidity=rng.randint(10, 100),
+        cloud=rng.randint(0, 100),
+        vis_km=10.0,
+        vis_miles=6.0,
+        uv=round(rng.uniform(0, 10), 1),
+        gust_mph=round(gust_kph / 1.609, 1),
+        gust_kph=gust_kph,
+    )
+    return data
+
+
+def _forecast_day(rng: random.Random, day: int) -> dict[str, Any]:
+    date_epoch = START_EPOCH + day * 86400
+    date = f"2026-10-{17 + day:02d}"
+
+    hours = []
+    for hour in range(24):
+        data = _weather(rng, 6 <= hour < 18)
+        data.update(
+            time_epoch=date_epoch + hour * 3600,
+            time=f"{date} {hour:02d}:00",
+            snow_cm=0.0,
+            will_it_rain=0,
+            chance_of_rain=rng.randint(0, 100),
+            will_it_snow=0,
+            chance_of_snow=0,
+        )
+        hours.append(data)
+
+    temps = [hour["temp_c"] for hour in hours]
+    return {
+        "date": date,
+        "date_epoch": date_epoch,
+        "day": {
+            "maxtemp_c": max(temps),
+            "maxtemp_f": round(max(temps) * 1.8 + 32, 1),
+            "mintemp_c": min(temps),
+            "mintemp_f": round(min(temps) * 1.8 + 32, 1),
+            "avgtemp_c": round(sum(temps) / len(temps), 1),
+            "avgtemp_f": round(sum(temps) / len(temps) * 1.8 + 32, 1),
+            "maxwind_mph": max(hour["wind_mph"] for hour in hours),
+            "maxwind_kph": max(hour["wind_kph"] for hour in hours),
+            "totalprecip_mm": round(sum(hour["precip_mm"] for hour in hours), 2),
+            "totalprecip_in": round(sum(hour["precip_in"] for hour in hours), 2),
+            "totalsnow_cm": 0.0,
+            "avgvis_km": 10.0,
+            "avgvis_miles": 6.0,
+            "avghumidity": sum(hour["humidity"] for hour in hours) // 24,
+            "daily_will_it_rain": 1,
+            "daily_chance_of_rain": max(hour["chance_of_rain"] for hour in hours),
+            "daily_will_it_snow": 0,
+            "daily_chance_of_snow": 0,
+            "condition": _condition(rng),
+            "uv": max(hour["uv"] for hour in hours),
+        },
+        "astro": {
+            "sunrise": "06:01 AM",
+            "sunset": "05:40 PM",
+            "moonrise": "No moonrise",
+            "moonset": "03:10 PM",
+            "moon_phase": "Waxing Crescent",
+            "moon_illumination": 12,
+            "is_moon_up": 0,
+            "is_sun_up": 1,
+        },
+        "hour": hours,
+    }
+
+
+def forecast_payload(days: int = 14, seed: int = 1) -> dict[str, Any]:
+    """Returns a ``forecast.json`` response for ``days`` days, with air quality."""
+    rng = random.Random(seed)
+
+    current = _weather(rng, True)
+    current.update(
+        last_updated_epoch=START_EPOCH + 12 * 3600,
+        last_updated="2026-10-17 12:00",
+        air_quality={
+            "co": 230.3,
+            "no2": 3.1,
+            "o3": 50.0,
+            "so2": 1.2,
+            "pm2_5": 5.5,
+            "pm10": 7.1,
+            "us-epa-index": 1,
+            "gb-defra-index": 1,
+        },
+    )
+
+    return {
+        "location": {
+            "name": "Springfield",
+            "region": "Example Region",
+            "country": "Example Country",
+            "lat": 10.0,
+            "lon": -80.0,
+            "tz_id": "America/Tegucigalpa",
+            "localtime_epoch": START_EPOCH + 12 * 3600,
+            "localtime": "2026-10-17 12:00",
+        },
+        "current": current,
+        "forecast": {"forecastday": [_forecast_day(rng, day) for day in range(days)]},
+    }
+
+
+def search_payload(results: int = 5, seed: int = 1) -> list[dict[str, Any]]:
+    """Returns a ``search.json`` response with ``results`` locations."""
+    rng = random.Random(seed)
+
+    locations = []
+    for ident in range(results):
+        name = f"Springfield {ident}" if ident else "Springfield"
+        locations.append(
+            {
+                "id": 1_000_000 + ident,
+                "name": name,
+                "region": f"Region {rng.randint(1, 50)}",
+                "country": rng.choice(["Example Country", "Other Country"]),
+                "lat": round(rng.uniform(-90, 90), 2),
+                "lon": round(rng.uniform(-180, 180), 2),
+                "url": name.lower().replace(" ", "-"),
+            }
+        )
+
+    return locations
+
+
+def encode(payload: Any) -> bytes:
+    """Returns ``payload`` encoded the way the API sends it."""
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+if __name__ == "__main__":
+    for name, payload in [("forecast", forecast_payload()), ("search", search_payload())]:
+        with open(f"{name}.json", "wb") as fp:
+            fp.write(encode(payload))
@@ -0,0 +1,144 @@
+"""Times loading the app resources from each source (see
+``atto_weather.resources.load_resources``), each run in a new interpreter with an
+offscreen QGuiApplication.
+
+Every run loads the resources and then the app icon plus 3 weather icons. RSS is the
+growth over that span. The ``rcc`` source needs ``pyside6-rcc`` on the PATH.
+
+    python benchmarks/resources.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+RUNS = 3
+ICONS = ["app/app_icon.png", "day_icons/1000.png", "day_icons/1003.png", "night_icons/1183.png"]
+
+
+def rss() -> int:
+    """Returns the resident set size of this process, in bytes."""
+    try:
+        import psutil
+    except ImportError:
+        # Linux only, without psutil
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    return psutil.Process().memory_info().rss
+
+
+def measure(source: str, rcc_file: str) -> None:
+    """Loads the resources from ``source`` and prints the measurements as JSON."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PySide6.QtGui import QGuiApplication, QPixmap
+
+    from atto_weather import resources
+
+    app = QGuiApplication([])  # noqa: F841 -- needed to create pixmaps
+
+    # hides the sources that come before the one measured
+    resources.ICONS_RCC = Path(rcc_file)
+    if source == "module":
+        resources.ICONS_QRC = Path(rcc_file).with_suffix(".missing")
+
+    rss_start = rss()
+    start = time.perf_counter()
+
+    loaded = resources.load_resources()
+    loaded_at = time.perf_counter()
+
+    for name in ICONS:
+        if QPixmap(resources.get_resource(name)).isNull():
+            raise RuntimeError(f"Could not load {name!r} from {loaded!r}")
+
+    print(
+        json.dumps(
+            {
+                "source": loaded,
+                "load": loaded_at - start,
+                "total": time.perf_counter() - start,
+                "rss": rss() - rss_start,
+            }
+        )
+    )
+
+
+def run(source: str, rcc_file: Path, env: dict[str, str]) -> dict[str, float]:
+    # the cached .pyc case needs bytecode to be written
+    env = {**os.environ, **env}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", source, str(rcc_file)],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    result = json.loads(output.stdout.splitlines()[-1])
+    if result["source"] != source:
+        raise RuntimeError(f"Expected resources from {source!r}, loaded {result['source']!r}")
+
+    return result
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        temp_path = Path(directory)
+        rcc_file = temp_path / "icons.rcc"
+        missing_rcc = temp_path / "missing.rcc"
+        warm_cache = {"PYTHONPYCACHEPREFIX": str(temp_path / "pycache")}
+
+        # a new bytecode cache every run, so icons_rc is compiled again
+        cases: list[tuple[str, str, Path, Callable[[int], dict[str, str]]]] = [
+            (
+                "module, no .pyc yet",
+                "module",
+                missing_rcc,
+                lambda idx: {"PYTHONPYCACHEPREFIX": str(temp_path / f"cold{idx}")},
+            ),
+            ("module, cached .pyc", "module", missing_rcc, lambda idx: warm_cache),
+            ("files", "files", missing_rcc, lambda idx: {}),
+        ]
+
+        rcc = shutil.which("pyside6-rcc")
+        if rcc is not None:
+            subprocess.run([rcc, "--binary", "icons/icons.qrc", "-o", str(rcc_file)], check=True)
+            cases.append(("rcc", "rcc", rcc_file, lambda idx: {}))
+
+        run("module", missing_rcc, warm_cache)
+
+        print(f"Python {platform.python_version()}, median of {RUNS} runs\n")
+        print(f"{'':22}{'load':>10}{'+ icons':>10}{'RSS':>12}")
+
+        for label, source, path, env in cases:
+            results = [run(source, path, env(idx)) for idx in range(RUNS)]
+
+            load = statistics.median(result["load"] for result in results)
+            total = statistics.median(result["total"] for result in results)
+            growth = statistics.median(result["rss"] for result in results)
+            print(
+                f"{label:22}{load * 1e3:>7.1f} ms{total * 1e3:>7.1f} ms{growth / 2**20:>+8.1f} MiB"
+            )
+
+        if rcc is None:
+            print(f"{'rcc':22}pyside6-rcc not found")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        measure(sys.argv[2], sys.argv[3])
+    else:
+        main()
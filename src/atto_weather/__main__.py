@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import Never
 
+from PySide6.QtCore import QThreadPool
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QApplication, QDialog, QMessageBox, QWidget
 
-from atto_weather import icons_rc  # noqa: F401 -- resource file
 from atto_weather._self import APP_VERSION
+from atto_weather.api.gazetteer import GazetteerLoader
 from atto_weather.app import AttoWeather
+from atto_weather.components.common import reserve_icon_cache
 from atto_weather.i18n import LanguageError, set_language
+from atto_weather.resources import get_resource, load_resources
 from atto_weather.store import load_secrets, load_settings, store, write_settings
 from atto_weather.utils.settings import DEFAULT_SETTINGS
 from atto_weather.windows.setup_wizard import SetupWizard
@@ -35,7 +38,10 @@ def run_wizard_if_setup_incomplete() -> None:
 
 def run() -> Never:
     app = QApplication()
-    app.setWindowIcon(QPixmap(":/app/app_icon.png"))
+
+    load_resources()
+    reserve_icon_cache()
+    app.setWindowIcon(QPixmap(get_resource("app/app_icon.png")))
 
     # https://stackoverflow.com/a/1552105
     if app.platformName() == "windows":
@@ -62,6 +68,9 @@ def run() -> Never:
     window = AttoWeather()
     window.show()
 
+    # ready by the time a location is added, without delaying the window
+    QThreadPool.globalInstance().start(GazetteerLoader())
+
     raise SystemExit(app.exec())
 
 
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from struct import Struct
+from struct import error as StructError
+from typing import Tuple
+
+from typing_extensions import TypeAlias
+
+from atto_weather.api.core import AutocompleteResult, WeatherInfo
+from atto_weather.api.snapshot import dump_snapshot, load_snapshot
+from atto_weather.store import CACHE_DIR
+
+LOGGER = logging.getLogger(__name__)
+
+CacheKey: TypeAlias = Tuple[str, int, bool, str]
+"""A forecast request as ``(query, days, aqi, lang)``."""
+
+SEARCH_RESULT_LIMIT = 10
+"""The most results ``search.json`` returns for a single query. A shorter list means
+that every location matching the query was returned."""
+
+MIN_FRESH_SECONDS = 60
+"""Minimum time an entry stays fresh after being stored, even if the API reports
+stale data (``last_updated_epoch`` far in the past)."""
+
+ENTRY_HEADER = Struct("<ddq")
+"""``stored_at``, ``expires_at`` and ``quota_left`` of an entry, followed on disk by the
+snapshot of its forecast."""
+
+
+@dataclass
+class CacheEntry:
+    weather: WeatherInfo
+    """The parsed ``forecast.json`` response."""
+    quota_left: int
+    """Requests left in the quota at the time the response was received."""
+    stored_at: float
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class ResponseCache:
+    """Persistent cache of forecast responses.
+
+    Entries are kept in memory and mirrored to ``directory`` (one binary snapshot per
+    key, see :mod:`atto_weather.api.snapshot`) so that they survive restarts without
+    decoding and parsing the response again. An entry is fresh until ``ttl`` seconds after the
+    ``last_updated_epoch`` of its current weather, which is when WeatherAPI is
+    expected to publish new data.
+
+    The cache may be accessed from both the GUI thread and worker threads.
+    """
+
+    def __init__(self, directory: Path, ttl: int = 900) -> None:
+        self.directory = directory
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: dict[CacheKey, CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey, *, allow_stale: bool = False) -> CacheEntry | None:
+        """Returns the entry for ``key`` if present and fresh (or any entry if
+        ``allow_stale`` is True)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._read(key)
+                if entry is not None:
+                    self._entries[key] = entry
+
+            if entry is not None and (allow_stale or entry.is_fresh):
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            return None
+
+    def put(self, key: CacheKey, weather: WeatherInfo, quota_left: int) -> CacheEntry:
+        """Stores the forecast ``weather`` for ``key``.
+
+        The entry returned holds ``weather`` as restored from its snapshot, which takes
+        a fraction of the memory of the decoded response behind ``weather``. It only
+        holds ``weather`` itself if no snapshot could be made.
+        """
+        now = time.time()
+        last_updated = weather.current.last_updated_epoch
+
+        entry = CacheEntry(
+            weather=weather,
+            quota_left=quota_left,
+            stored_at=now,
+            expires_at=max(last_updated + self.ttl, now + MIN_FRESH_SECONDS),
+        )
+
+        buf = self._pack(key, entry)
+        if buf is not None:
+            entry.weather = load_snapshot(buf, ENTRY_HEADER.size)
+
+        with self._lock:
+            self._entries[key] = entry
+            if buf is not None:
+                self._write(key, buf)
+
+        return entry
+
+    def clear(self) -> None:
+        """Removes every entry, both in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+
+            # JSON entries were written by earlier versions
+            for pattern in ("*.snap", "*.json"):
+                for path in self.directory.glob(pattern):
+                    path.unlink(missing_ok=True)
+
+    def _path(self, key: CacheKey) -> Path:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return self.directory / f"{digest}.snap"
+
+    def _read(self, key: CacheKey) -> CacheEntry | None:
+        try:
+            # a single read, the hours are only unpacked from the buffer when shown
+            with open(self._path(key), "rb") as fp:
+                buf = fp.read()
+
+            stored_at, expires_at, quota_left = ENTRY_HEADER.unpack_from(buf)
+            weather = load_snapshot(buf, ENTRY_HEADER.size)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            # e.g. a permission error, the entry is treated as missing
+            LOGGER.warning(f"Could not read cache entry for {key!r}: {exc}")
+            return None
+        except (StructError, ValueError) as exc:
+            LOGGER.warning(f"Discarding unreadable cache entry for {key!r}: {exc}")
+            return None
+
+        return CacheEntry(weather, quota_left, stored_at, expires_at)
+
+    def _pack(self, key: CacheKey, entry: CacheEntry) -> bytes | None:
+        """Returns the contents of the file of ``entry``."""
+        try:
+            header = ENTRY_HEADER.pack(entry.stored_at, entry.expires_at, entry.quota_left)
+            return header + dump_snapshot(entry.weather)
+        except (StructError, KeyError, IndexError, TypeError, ValueError) as exc:
+            LOGGER.warning(f"Could not snapshot cache entry for {key!r}: {exc!r}")
+            return None
+
+    def _write(self, key: CacheKey, buf: bytes) -> None:
+        path = self._path(key)
+        temp_path = path.with_suffix(".tmp")
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as fp:
+                fp.write(buf)
+
+            os.replace(temp_path, path)
+        except OSError as exc:
+            LOGGER.warning(f"Could not persist cache entry for {key!r}: {exc}")
+
+
+def normalize_query(query: str) -> str:
+    """Returns the form under which autocomplete results for ``query`` are cached."""
+    return " ".join(query.casefold().split())
+
+
+class AutocompleteCache:
+    """In-memory LRU cache of autocomplete results keyed by normalized query.
+
+    A query missing from the cache may still be answered from one of its prefixes:
+    if the results for the prefix are complete (fewer than
+    :data:`SEARCH_RESULT_LIMIT`), the results for the longer query are assumed to be
+    those whose full name contains it. Prefix answers that would come out empty are
+    not trusted, as the API may match on more than the location name.
+
+    The cache must only be used from the GUI thread.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[str, list[AutocompleteResult]] = OrderedDict()
+
+    def get(self, query: str) -> list[AutocompleteResult] | None:
+        """Returns the results for ``query`` if they are cached or can be derived from
+        the results of a prefix."""
+        query = normalize_query(query)
+
+        results = self._entries.get(query)
+        if results is not None:
+            self._entries.move_to_end(query)
+            self.hits += 1
+            return results
+
+        for end in range(len(query) - 1, 0, -1):
+            prefix_results = self._entries.get(query[:end])
+            if prefix_results is None:
+                continue
+
+            if len(prefix_results) >= SEARCH_RESULT_LIMIT:
+                break  # possibly truncated, so are the results of any shorter prefix
+
+            results = [
+                result for result in prefix_results if query in normalize_query(result.full_name)
+            ]
+            if not results:
+                break
+
+            self.put(query, results)
+            self.prefix_hits += 1
+            return results
+
+        self.misses += 1
+        return None
+
+    def put(self, query: str, results: list[AutocompleteResult]) -> None:
+        """Stores the autocomplete ``results`` for ``query``."""
+        query = normalize_query(query)
+
+        self._entries[query] = results
+        self._entries.move_to_end(query)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+response_cache = ResponseCache(CACHE_DIR)
+autocomplete_cache = AutocompleteCache()
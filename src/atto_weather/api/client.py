@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+
+import httpx
+
+from atto_weather._self import APP_VERSION
+
+USER_AGENT = f"aescarias/atto-weather {APP_VERSION}"
+BASE_URL = "https://api.weatherapi.com/v1"
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ClientConfig:
+    """Connection settings for the shared HTTP client."""
+
+    max_connections: int = 10
+    """The maximum amount of concurrent connections to the API."""
+
+    max_keepalive_connections: int = 5
+    """The maximum amount of idle connections kept open in the pool."""
+
+    keepalive_expiry: float = 30.0
+    """Seconds an idle connection stays in the pool before being closed."""
+
+    timeout: httpx.Timeout = field(
+        default_factory=lambda: httpx.Timeout(10.0, connect=5.0, pool=10.0)
+    )
+    """Timeouts applied to every request made through the client."""
+
+    http2: bool = False
+    """Whether to negotiate HTTP/2. Requires the ``h2`` package (``httpx[http2]``)."""
+
+
+_config = ClientConfig()
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def configure_client(config: ClientConfig) -> None:
+    """Replaces the settings used by the shared client.
+
+    The current client (if any) is closed so that the next call to :func:`get_client`
+    creates one with the new settings.
+    """
+    global _config
+
+    with _client_lock:
+        _config = config
+        _close_unlocked()
+
+
+def get_client() -> httpx.Client:
+    """Returns the process-wide HTTP client, creating it on first use.
+
+    ``httpx.Client`` is thread-safe, so the same instance (and its connection pool)
+    is shared by every worker in the thread pool.
+    """
+    global _client
+
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = _create_client(_config)
+
+        return _client
+
+
+def close_client() -> None:
+    """Closes the shared client and every connection in its pool."""
+    with _client_lock:
+        _close_unlocked()
+
+
+def _close_unlocked() -> None:
+    global _client
+
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def _create_client(config: ClientConfig) -> httpx.Client:
+    http2 = config.http2
+    if http2 and find_spec("h2") is None:
+        LOGGER.warning("HTTP/2 was requested but 'h2' is not installed. Using HTTP/1.1.")
+        http2 = False
+
+    return httpx.Client(
+        base_url=BASE_URL,
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        timeout=config.timeout,
+        http2=http2,
+    )
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import sys
 from dataclasses import dataclass, fields, is_dataclass
-from typing import Any, Protocol, TypeVar
-
-from typing_extensions import Self
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from typing_extensions import Self, TypeAlias
 
 
 class SupportsFromDict(Protocol):
@@ -13,22 +25,162 @@ class SupportsFromDict(Protocol):
 
 
 T = TypeVar("T", bound=SupportsFromDict)
+ItemT = TypeVar("ItemT")
 
+FieldSource: TypeAlias = Union[str, Tuple[Any, ...]]
+"""Where the value of a field comes from: either a key of the API response, or a
+tuple of a callable followed by the keys whose values it is called with."""
 
-def map_to_dataclass(cls: type[T], data: dict[str, Any]) -> T:
+FieldMap: TypeAlias = Dict[str, FieldSource]
+
+_parsers: dict[type, Callable[[dict[str, Any]], Any]] = {}
+_conditions: dict[tuple[str, str, int], Condition] = {}
+
+if sys.version_info >= (3, 10):
+    # a WeatherInfo is made of thousands of small objects, slots save a dict on each
+    model = dataclass(slots=True)
+    frozen_model = dataclass(frozen=True, slots=True)
+else:
+    model = dataclass
+    frozen_model = dataclass(frozen=True)
+
+
+def list_of(parse: Callable[[Any], Any]) -> Callable[[list[Any]], list[Any]]:
+    """Returns a converter applying ``parse`` to every item of a list."""
+
+    def parse_list(items: list[Any]) -> list[Any]:
+        return [parse(item) for item in items]
+
+    return parse_list
+
+
+class LazySequence(Sequence[ItemT]):
+    """Read-only sequence that keeps the raw items of an API response and parses each
+    one on first access."""
+
+    __slots__ = ("_raw", "_parse", "_items")
+
+    def __init__(self, raw: list[Any], parse: Callable[[Any], ItemT]) -> None:
+        self._raw = raw
+        self._parse = parse
+        self._items: list[ItemT | None] | None = None
+
+    @property
+    def raw(self) -> list[Any]:
+        """The unparsed items."""
+        return self._raw
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> ItemT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ItemT]: ...
+
+    def __getitem__(self, index: int | slice) -> ItemT | list[ItemT]:
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self._raw)))]
+
+        if self._items is None:
+            self._items = [None] * len(self._raw)
+
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._parse(self._raw[index])
+
+        return item
+
+    def __iter__(self) -> Iterator[ItemT]:
+        # iterating means every item is needed, parse the missing ones in one go
+        if self._items is None:
+            self._items = [self._parse(raw) for raw in self._raw]
+        else:
+            for idx, item in enumerate(self._items):
+                if item is None:
+                    self._items[idx] = self._parse(self._raw[idx])
+
+        return iter(self._items)  # type: ignore[arg-type]
+
+    def iter_uncached(self) -> Iterator[ItemT]:
+        """Iterates over the items without keeping the ones parsed for it, e.g. to
+        serialize them once."""
+        items = self._items or [None] * len(self._raw)
+        for item, raw in zip(items, self._raw):
+            yield self._parse(raw) if item is None else item
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazySequence):
+            # no need to parse anything if both come from identical responses
+            return self._parse == other._parse and self._raw == other._raw
+
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._raw)} items)"
+
+
+def lazy_list_of(parse: Callable[[Any], ItemT]) -> Callable[[list[Any]], LazySequence[ItemT]]:
+    """Returns a converter wrapping a list in a :class:`LazySequence` parsed with
+    ``parse``."""
+
+    def parse_list(items: list[Any]) -> LazySequence[ItemT]:
+        return LazySequence(items, parse)
+
+    return parse_list
+
+
+def compile_parser(cls: type[T]) -> Callable[[dict[str, Any]], T]:
+    """Generates a function that creates an instance of the dataclass ``cls`` from an
+    API response.
+
+    Each field is read from the key in the ``FIELD_MAP`` of ``cls`` or, if not listed
+    there, from the key named like the field. Keys the class does not use are ignored.
+    """
     if not is_dataclass(cls):
         raise ValueError("object not dataclass")
 
-    mapped: dict[str, Any] = {}
+    field_map: FieldMap = getattr(cls, "FIELD_MAP", {})
+    init_fields = [field.name for field in fields(cls) if field.init]
+
+    unknown = field_map.keys() - set(init_fields)
+    if unknown:
+        raise ValueError(f"FIELD_MAP of {cls.__name__} has unknown fields: {sorted(unknown)}")
+
+    namespace: dict[str, Any] = {"cls": cls}
+    args = []
 
-    for field in fields(cls):
-        if field.name in data:
-            mapped[field.name] = data[field.name]
+    for name in init_fields:
+        source = field_map.get(name, name)
+        if isinstance(source, str):
+            args.append(f"data[{source!r}]")
+            continue
 
-    return cls(**data)
+        convert, *keys = source
+        namespace[f"convert_{name}"] = convert
+        args.append(f"convert_{name}({', '.join(f'data[{key!r}]' for key in keys)})")
 
+    code = f"def parse(data):\n    return cls({', '.join(args)})\n"
+    exec(compile(code, f"<parser {cls.__qualname__}>", "exec"), namespace)
 
-@dataclass
+    return namespace["parse"]
+
+
+def map_to_dataclass(cls: type[T], data: dict[str, Any]) -> T:
+    """Creates an instance of the dataclass ``cls`` from the API response ``data``
+    using a parser compiled on first use (see :func:`compile_parser`)."""
+    parser = _parsers.get(cls)
+    if parser is None:
+        parser = _parsers[cls] = compile_parser(cls)
+
+    return parser(data)
+
+
+@model
 class Location:
     latitude: float
     longitude: float
@@ -39,15 +191,15 @@ class Location:
     localtime_epoch: int
     localtime_formatted: str
 
+    FIELD_MAP: ClassVar[FieldMap] = {
+        "latitude": "lat",
+        "longitude": "lon",
+        "timezone_id": (sys.intern, "tz_id"),
+        "localtime_formatted": "localtime",
+    }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        data = deepcopy(data)
-
-        data["timezone_id"] = data.pop("tz_id")
-        data["latitude"] = data.pop("lat")
-        data["longitude"] = data.pop("lon")
-        data["localtime_formatted"] = data.pop("localtime")
-
         return map_to_dataclass(cls, data)
 
     @property
@@ -55,7 +207,7 @@ class Location:
         return ", ".join(comp for comp in [self.name, self.region, self.country] if comp)
 
 
-@dataclass
+@model
 class AutocompleteResult:
     ident: int
     name: str
@@ -65,12 +217,10 @@ class AutocompleteResult:
     lon: float
     url: str
 
+    FIELD_MAP: ClassVar[FieldMap] = {"ident": "id"}
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        data = deepcopy(data)
-
-        data["ident"] = data.pop("id")
-
         return map_to_dataclass(cls, data)
 
     @property
@@ -78,37 +228,37 @@ class AutocompleteResult:
         return ", ".join(comp for comp in [self.name, self.region, self.country] if comp)
 
 
-@dataclass
+@model
 class Temperature:
     celsius: float
     fahrenheit: float
 
 
-@dataclass
+@model
 class Distance:
     miles: float
     kilometers: float
 
 
-@dataclass
+@model
 class Speed:
     miles_per_hour: float
     kilometers_per_hour: float
 
 
-@dataclass
+@model
 class Pressure:
     millibars: float
     inches_hg: float
 
 
-@dataclass
+@model
 class Height:
     millimeters: float
     inches: float
 
 
-@dataclass
+@model
 class AirQuality:
     co: float
     o3: float
@@ -119,28 +269,43 @@ class AirQuality:
     us_epa_index: int
     gb_defra_index: int
 
+    FIELD_MAP: ClassVar[FieldMap] = {
+        "us_epa_index": "us-epa-index",
+        "gb_defra_index": "gb-defra-index",
+    }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        data = deepcopy(data)
-
-        data["us_epa_index"] = data.pop("us-epa-index")
-        data["gb_defra_index"] = data.pop("gb-defra-index")
-
         return map_to_dataclass(cls, data)
 
 
-@dataclass
+@frozen_model
 class Condition:
+    """A weather condition. Conditions are shared by every model that has the same
+    one (see :meth:`shared`), hence frozen."""
+
     text: str
     icon: str
     code: int
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Self:
-        return map_to_dataclass(cls, data)
+    def shared(cls, text: str, icon: str, code: int) -> Condition:
+        """Returns the condition with these values, creating it on first use."""
+        # the icon tells day and night apart and the text is localized, so the
+        # key also covers the (code, is_day, lang) of the condition
+        key = (text, icon, code)
+        condition = _conditions.get(key)
+        if condition is None:
+            condition = _conditions[key] = cls(sys.intern(text), sys.intern(icon), code)
+
+        return condition
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Condition:
+        return cls.shared(data["text"], data["icon"], data["code"])
 
-@dataclass
+
+@model
 class CurrentWeather:
     last_updated_formatted: str
     last_updated_epoch: int
@@ -163,52 +328,32 @@ class CurrentWeather:
     gust_speed: Speed
     air_quality: AirQuality
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(
-            last_updated_formatted=data["last_updated"],
-            last_updated_epoch=data["last_updated_epoch"],
-            temperature=Temperature(data["temp_c"], data["temp_f"]),
-            feels_like=Temperature(data["feelslike_c"], data["feelslike_f"]),
-            windchill=Temperature(data["windchill_c"], data["windchill_f"]),
-            heat_index=Temperature(data["heatindex_c"], data["heatindex_f"]),
-            dew_point=Temperature(data["dewpoint_c"], data["dewpoint_f"]),
-            visibility=Distance(data["vis_miles"], data["vis_km"]),
-            condition=Condition.from_dict(data["condition"]),
-            wind_speed=Speed(data["wind_mph"], data["wind_kph"]),
-            wind_degree=data["wind_degree"],
-            wind_direction=data["wind_dir"],
-            pressure=Pressure(data["pressure_mb"], data["pressure_in"]),
-            precipitation=Height(data["precip_mm"], data["precip_in"]),
-            humidity=data["humidity"],
-            cloud_cover=data["cloud"],
-            is_day=bool(data["is_day"]),
-            uv_index=data["uv"],
-            gust_speed=Speed(data["gust_mph"], data["gust_kph"]),
-            air_quality=AirQuality.from_dict(data["air_quality"]),
-        )
-
-
-@dataclass
-class Forecast:
-    date_formatted: str
-    date_epoch: int
-    day: ForecastDay
-    astronomy: Astronomy
-    hours: list[ForecastHour]
+    FIELD_MAP: ClassVar[FieldMap] = {
+        "last_updated_formatted": "last_updated",
+        "temperature": (Temperature, "temp_c", "temp_f"),
+        "feels_like": (Temperature, "feelslike_c", "feelslike_f"),
+        "windchill": (Temperature, "windchill_c", "windchill_f"),
+        "heat_index": (Temperature, "heatindex_c", "heatindex_f"),
+        "dew_point": (Temperature, "dewpoint_c", "dewpoint_f"),
+        "visibility": (Distance, "vis_miles", "vis_km"),
+        "condition": (Condition.from_dict, "condition"),
+        "wind_speed": (Speed, "wind_mph", "wind_kph"),
+        "wind_direction": (sys.intern, "wind_dir"),
+        "pressure": (Pressure, "pressure_mb", "pressure_in"),
+        "precipitation": (Height, "precip_mm", "precip_in"),
+        "cloud_cover": "cloud",
+        "is_day": (bool, "is_day"),
+        "uv_index": "uv",
+        "gust_speed": (Speed, "gust_mph", "gust_kph"),
+        "air_quality": (AirQuality.from_dict, "air_quality"),
+    }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(
-            date_formatted=data["date"],
-            date_epoch=data["date_epoch"],
-            day=ForecastDay.from_dict(data["day"]),
-            astronomy=Astronomy.from_dict(data["astro"]),
-            hours=[ForecastHour.from_dict(hour) for hour in data["hour"]],
-        )
+        return map_to_dataclass(cls, data)
 
 
-@dataclass
+@model
 class ForecastDay:
     max_temperature: Temperature
     min_temperature: Temperature
@@ -225,27 +370,29 @@ class ForecastDay:
     chance_of_rain: int
     chance_of_snow: int
 
+    FIELD_MAP: ClassVar[FieldMap] = {
+        "max_temperature": (Temperature, "maxtemp_c", "maxtemp_f"),
+        "min_temperature": (Temperature, "mintemp_c", "mintemp_f"),
+        "avg_temperature": (Temperature, "avgtemp_c", "avgtemp_f"),
+        "max_wind_speed": (Speed, "maxwind_mph", "maxwind_kph"),
+        "total_precipitation": (Height, "totalprecip_mm", "totalprecip_in"),
+        "total_snowfall_cm": "totalsnow_cm",
+        "avg_visibility": (Distance, "avgvis_miles", "avgvis_km"),
+        "avg_humidity": "avghumidity",
+        "condition": (Condition.from_dict, "condition"),
+        "uv_index": "uv",
+        "will_it_rain": (bool, "daily_will_it_rain"),
+        "will_it_snow": (bool, "daily_will_it_snow"),
+        "chance_of_rain": "daily_chance_of_rain",
+        "chance_of_snow": "daily_chance_of_snow",
+    }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(
-            max_temperature=Temperature(data["maxtemp_c"], data["maxtemp_f"]),
-            min_temperature=Temperature(data["mintemp_c"], data["mintemp_f"]),
-            avg_temperature=Temperature(data["avgtemp_c"], data["avgtemp_f"]),
-            max_wind_speed=Speed(data["maxwind_mph"], data["maxwind_kph"]),
-            total_precipitation=Height(data["totalprecip_mm"], data["totalprecip_in"]),
-            total_snowfall_cm=data["totalsnow_cm"],
-            avg_visibility=Distance(data["avgvis_miles"], data["avgvis_km"]),
-            avg_humidity=data["avghumidity"],
-            condition=Condition.from_dict(data["condition"]),
-            uv_index=data["uv"],
-            will_it_rain=bool(data["daily_will_it_rain"]),
-            will_it_snow=bool(data["daily_will_it_snow"]),
-            chance_of_rain=data["daily_chance_of_rain"],
-            chance_of_snow=data["daily_chance_of_snow"],
-        )
-
-
-@dataclass
+        return map_to_dataclass(cls, data)
+
+
+@model
 class ForecastHour:
     time_epoch: int
     time_formatted: str
@@ -267,42 +414,39 @@ class ForecastHour:
     will_it_snow: bool
     chance_of_rain: int
     chance_of_snow: int
-    is_day: int
+    is_day: bool
     visibility: Distance
     gust_speed: Speed
     uv_index: float
 
+    FIELD_MAP: ClassVar[FieldMap] = {
+        "time_formatted": (sys.intern, "time"),
+        "temperature": (Temperature, "temp_c", "temp_f"),
+        "condition": (Condition.from_dict, "condition"),
+        "wind_speed": (Speed, "wind_mph", "wind_kph"),
+        "wind_direction": (sys.intern, "wind_dir"),
+        "pressure": (Pressure, "pressure_mb", "pressure_in"),
+        "precipitation": (Height, "precip_mm", "precip_in"),
+        "snowfall_cm": "snow_cm",
+        "cloud_cover": "cloud",
+        "feels_like": (Temperature, "feelslike_c", "feelslike_f"),
+        "windchill": (Temperature, "windchill_c", "windchill_f"),
+        "heat_index": (Temperature, "heatindex_c", "heatindex_f"),
+        "dew_point": (Temperature, "dewpoint_c", "dewpoint_f"),
+        "will_it_rain": (bool, "will_it_rain"),
+        "will_it_snow": (bool, "will_it_snow"),
+        "is_day": (bool, "is_day"),
+        "visibility": (Distance, "vis_miles", "vis_km"),
+        "gust_speed": (Speed, "gust_mph", "gust_kph"),
+        "uv_index": "uv",
+    }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(
-            time_epoch=data["time_epoch"],
-            time_formatted=data["time"],
-            temperature=Temperature(data["temp_c"], data["temp_f"]),
-            condition=Condition.from_dict(data["condition"]),
-            wind_speed=Speed(data["wind_mph"], data["wind_kph"]),
-            wind_degree=data["wind_degree"],
-            wind_direction=data["wind_dir"],
-            pressure=Pressure(data["pressure_mb"], data["pressure_in"]),
-            precipitation=Height(data["precip_mm"], data["precip_in"]),
-            snowfall_cm=data["snow_cm"],
-            humidity=data["humidity"],
-            cloud_cover=data["cloud"],
-            feels_like=Temperature(data["feelslike_c"], data["feelslike_f"]),
-            windchill=Temperature(data["windchill_c"], data["windchill_f"]),
-            heat_index=Temperature(data["heatindex_c"], data["heatindex_f"]),
-            dew_point=Temperature(data["dewpoint_c"], data["dewpoint_f"]),
-            will_it_rain=bool(data["will_it_rain"]),
-            will_it_snow=bool(data["will_it_snow"]),
-            is_day=bool(data["is_day"]),
-            visibility=Distance(data["vis_miles"], data["vis_km"]),
-            chance_of_rain=data["chance_of_rain"],
-            chance_of_snow=data["chance_of_snow"],
-            gust_speed=Speed(data["gust_mph"], data["gust_kph"]),
-            uv_index=data["uv"],
-        )
-
-
-@dataclass
+        return map_to_dataclass(cls, data)
+
+
+@model
 class Astronomy:
     sunrise: str
     sunset: str
@@ -313,28 +457,52 @@ class Astronomy:
     is_moon_up: bool
     is_sun_up: bool
 
+    FIELD_MAP: ClassVar[FieldMap] = {
+        "is_moon_up": (bool, "is_moon_up"),
+        "is_sun_up": (bool, "is_sun_up"),
+    }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        data = deepcopy(data)
+        return map_to_dataclass(cls, data)
+
+
+@model
+class Forecast:
+    date_formatted: str
+    date_epoch: int
+    day: ForecastDay
+    astronomy: Astronomy
+    hours: Sequence[ForecastHour]
+    """Parsed on access, see :class:`LazySequence`."""
 
-        data["is_moon_up"] = bool(data.pop("is_moon_up"))
-        data["is_sun_up"] = bool(data.pop("is_sun_up"))
+    FIELD_MAP: ClassVar[FieldMap] = {
+        "date_formatted": "date",
+        "day": (ForecastDay.from_dict, "day"),
+        "astronomy": (Astronomy.from_dict, "astro"),
+        "hours": (lazy_list_of(ForecastHour.from_dict), "hour"),
+    }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
         return map_to_dataclass(cls, data)
 
 
-@dataclass
+@model
 class WeatherInfo:
     location: Location
     current: CurrentWeather
     forecasts: list[Forecast]
 
+    FIELD_MAP: ClassVar[FieldMap] = {
+        "location": (Location.from_dict, "location"),
+        "current": (CurrentWeather.from_dict, "current"),
+        "forecasts": (lambda forecast: _parse_forecasts(forecast["forecastday"]), "forecast"),
+    }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(
-            location=Location.from_dict(data["location"]),
-            current=CurrentWeather.from_dict(data["current"]),
-            forecasts=[
-                Forecast.from_dict(forecast) for forecast in data["forecast"]["forecastday"]
-            ],
-        )
+        return map_to_dataclass(cls, data)
+
+
+_parse_forecasts = list_of(Forecast.from_dict)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import logging
+from importlib import import_module
+from json import JSONDecodeError
+from typing import Any, Callable, Literal
+
+from typing_extensions import TypeAlias
+
+LOGGER = logging.getLogger(__name__)
+
+JSONBackend: TypeAlias = Literal["auto", "orjson", "msgspec", "json"]
+
+PREFERRED_BACKENDS = ("orjson", "msgspec", "json")
+"""Backends tried by ``"auto"``, fastest first."""
+
+
+def _load_json() -> Callable[[bytes], Any]:
+    return json.loads
+
+
+def _load_orjson() -> Callable[[bytes], Any]:
+    # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+    return import_module("orjson").loads
+
+
+def _load_msgspec() -> Callable[[bytes], Any]:
+    msgspec = import_module("msgspec")
+    decoder = msgspec.json.Decoder()
+
+    def decode(content: bytes) -> Any:
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as exc:
+            raise JSONDecodeError(str(exc), content.decode("utf-8", "replace"), 0) from exc
+
+    return decode
+
+
+_LOADERS: dict[str, Callable[[], Callable[[bytes], Any]]] = {
+    "orjson": _load_orjson,
+    "msgspec": _load_msgspec,
+    "json": _load_json,
+}
+
+backend = "json"
+"""The name of the backend in use."""
+
+_decode: Callable[[bytes], Any] = json.loads
+
+
+def set_backend(name: JSONBackend) -> str:
+    """Selects the library used to decode API responses.
+
+    ``"auto"`` picks the fastest installed backend. Falls back to the standard
+    library if the requested one is not installed. Returns the backend in use.
+    """
+    global backend, _decode
+
+    candidates = PREFERRED_BACKENDS if name == "auto" else (name, "json")
+    for candidate in candidates:
+        try:
+            decode = _LOADERS[candidate]()
+        except ImportError:
+            if name != "auto":
+                LOGGER.warning(f"JSON backend {candidate!r} is not installed, using 'json'.")
+            continue
+        except KeyError:
+            raise ValueError(f"Unknown JSON backend: {candidate!r}") from None
+
+        backend, _decode = candidate, decode
+        return backend
+
+    raise AssertionError("the standard library backend is always available")
+
+
+def decode_json(content: bytes) -> Any:
+    """Decodes the JSON document ``content`` with the selected backend.
+
+    Raises :class:`json.JSONDecodeError` for malformed documents, whatever the backend.
+    """
+    return _decode(content)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import unicodedata
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any
+
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+from atto_weather.api.cache import SEARCH_RESULT_LIMIT
+from atto_weather.api.core import AutocompleteResult
+from atto_weather.store import GAZETTEER_FILE
+
+LOGGER = logging.getLogger(__name__)
+
+
+def fold_name(name: str) -> str:
+    """Returns ``name`` casefolded, without diacritics and with whitespace collapsed,
+    so that "zurich" matches "Zürich"."""
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.split())
+
+
+class Gazetteer:
+    """Offline index of locations for autocomplete.
+
+    Locations are indexed by the folded form of their full name in a sorted array, so
+    a prefix search is a binary search followed by a scan over the matching range.
+    """
+
+    def __init__(self, locations: list[AutocompleteResult]) -> None:
+        self.locations = locations
+
+        index = sorted(
+            (fold_name(location.full_name), idx) for idx, location in enumerate(locations)
+        )
+        self._keys = [key for key, _ in index]
+        self._positions = [idx for _, idx in index]
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    @classmethod
+    def from_list(cls, data: list[dict[str, Any]]) -> Gazetteer:
+        """Creates a gazetteer from a list of ``search.json`` results."""
+        return cls([AutocompleteResult.from_dict(item) for item in data])
+
+    def search(self, query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[AutocompleteResult]:
+        """Returns up to ``limit`` locations whose full name starts with ``query``."""
+        prefix = fold_name(query)
+        if not prefix:
+            return []
+
+        results = []
+        pos = bisect_left(self._keys, prefix)
+
+        while pos < len(self._keys) and len(results) < limit:
+            if not self._keys[pos].startswith(prefix):
+                break
+
+            results.append(self.locations[self._positions[pos]])
+            pos += 1
+
+        return results
+
+
+_gazetteer: Gazetteer | None = None
+_loaded = False
+_load_lock = threading.Lock()
+
+
+def load_gazetteer(path: Path = GAZETTEER_FILE) -> Gazetteer | None:
+    """Loads the gazetteer at ``path``. Returns None if there is no usable file."""
+    try:
+        with open(path, encoding="utf-8") as fp:
+            gazetteer = Gazetteer.from_list(json.load(fp))
+    except FileNotFoundError:
+        return None
+    except (ValueError, TypeError, KeyError) as exc:
+        LOGGER.warning(f"Ignoring unreadable gazetteer {path}: {exc!r}")
+        return None
+
+    LOGGER.info(f"Loaded gazetteer with {len(gazetteer)} location(s).")
+    return gazetteer
+
+
+def get_gazetteer() -> Gazetteer | None:
+    """Returns the gazetteer at :data:`GAZETTEER_FILE`, loading it on first use, or
+    None if there is none.
+
+    Loading a large gazetteer takes a noticeable time, the GUI thread should only call
+    this once :func:`is_gazetteer_loaded` (see :class:`GazetteerLoader`)."""
+    global _gazetteer, _loaded
+
+    # a loader may still be running when another one starts, only one reads the file
+    with _load_lock:
+        if not _loaded:
+            _gazetteer = load_gazetteer()
+            _loaded = True
+
+    return _gazetteer
+
+
+def is_gazetteer_loaded() -> bool:
+    return _loaded
+
+
+class GazetteerLoaderSignals(QObject):
+    loaded = Signal(object)
+    """Emitted with the :class:`Gazetteer`, or None if there is none."""
+
+
+class GazetteerLoader(QRunnable):
+    """Runnable that loads the gazetteer (see :func:`get_gazetteer`) off the GUI thread."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.signals = GazetteerLoaderSignals()
+
+    @Slot()
+    def run(self) -> None:
+        self.signals.loaded.emit(get_gazetteer())
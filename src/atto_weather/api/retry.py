@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+import httpx
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+"""Status codes of responses to transient failures."""
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Describes how a failed request is retried.
+
+    Delays grow exponentially from ``base_delay`` up to ``max_delay`` and are
+    randomized ("full jitter") so that clients failing together do not retry together.
+    """
+
+    max_attempts: int
+    """Total attempts, including the first one."""
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    deadline: float = 30.0
+    """Seconds after the first attempt past which no retry is started."""
+    retry_unsafe: bool = False
+    """Whether non-idempotent methods may be retried. Only enable this for requests
+    that do not modify anything on the server (e.g. a POST used as a query)."""
+
+    def backoff(self, attempt: int) -> float:
+        """Returns a delay before the attempt following failed ``attempt`` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        method: str,
+        response: httpx.Response | None = None,
+    ) -> float | None:
+        """Returns the delay before retrying failed ``attempt``, or None if it should not
+        be retried.
+
+        Args:
+            attempt: The attempt that failed (1-based).
+            elapsed: Seconds since the first attempt started.
+            method: The HTTP method of the request.
+            response: The error response, or None if the request failed at the
+                transport level (connection errors, timeouts).
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if method not in IDEMPOTENT_METHODS and not self.retry_unsafe:
+            return None
+
+        if response is not None and response.status_code not in RETRYABLE_STATUS_CODES:
+            return None
+
+        delay = self.backoff(attempt)
+        if response is not None:
+            try:
+                delay = max(delay, float(response.headers.get("retry-after", 0)))
+            except ValueError:
+                pass  # an HTTP date, not worth parsing
+
+        if elapsed + delay > self.deadline:
+            return None
+
+        return delay
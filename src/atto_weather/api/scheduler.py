@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Slot
+
+if TYPE_CHECKING:
+    from atto_weather.api.worker import WeatherWorker
+
+LOGGER = logging.getLogger(__name__)
+
+QUOTA_EXCEEDED = 2007
+"""WeatherAPI error code for an exhausted quota."""
+
+QUOTA_WINDOW_MS = 60_000
+"""How long held requests wait before the quota estimate is considered outdated."""
+
+
+class RequestPriority(IntEnum):
+    PREFETCH = 0
+    """Requests made ahead of time for data the user has not asked for yet."""
+    BACKGROUND = 1
+    """Refreshes of data that is already being displayed."""
+    INTERACTIVE = 2
+    """Requests the user is actively waiting on."""
+
+
+QUOTA_RESERVE = {
+    RequestPriority.INTERACTIVE: 0,
+    RequestPriority.BACKGROUND: 5,
+    RequestPriority.PREFETCH: 20,
+}
+"""Quota left untouched by each priority so that more important requests can still run."""
+
+
+class RequestScheduler(QObject):
+    """Queues worker requests by priority and paces them according to the API quota.
+
+    The scheduler keeps an estimate of the remaining quota, updated with the
+    ``x-weatherapi-qpm-left`` value of each response and lowered with every request it
+    starts. A request only starts while the estimate stays above the reserve of its
+    priority, so background refreshes and prefetches back off before interactive
+    requests would hit error 2007. Held requests are retried once the quota is
+    refreshed by a response or after :data:`QUOTA_WINDOW_MS`.
+
+    At most ``max_active`` requests run at once, the rest wait in priority order.
+    The scheduler must only be used from the GUI thread.
+    """
+
+    def __init__(self, max_active: int = 4, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+
+        self.max_active = max_active
+        self.quota_left: int | None = None
+        """Estimated requests left in the quota, or None if unknown."""
+
+        self._queue: list[tuple[int, int, QThreadPool, WeatherWorker]] = []
+        self._order = itertools.count()
+        self._window_pending = False
+
+        # Running workers by their signals object. Holding them here keeps the signals
+        # alive until the GUI thread has delivered everything they emitted, as slots
+        # without a receiver object (lambdas, partials) are queued on the sender.
+        self._running: dict[QObject, WeatherWorker] = {}
+
+    @property
+    def pending(self) -> int:
+        """The amount of requests waiting to be started."""
+        return len(self._queue)
+
+    def submit(self, pool: QThreadPool, worker: WeatherWorker, priority: RequestPriority) -> None:
+        """Queues ``worker`` to be started in ``pool`` as soon as its ``priority`` allows."""
+        heapq.heappush(self._queue, (-priority, next(self._order), pool, worker))
+        self._dispatch()
+
+    def promote(self, worker: WeatherWorker, priority: RequestPriority) -> None:
+        """Raises the priority of ``worker`` if it is still waiting to be started."""
+        for idx, (neg_priority, order, pool, queued) in enumerate(self._queue):
+            if queued is worker and -neg_priority < priority:
+                self._queue[idx] = (-priority, order, pool, queued)
+                heapq.heapify(self._queue)
+                self._dispatch()
+                return
+
+    def discard(self, worker: WeatherWorker) -> bool:
+        """Removes ``worker`` from the queue. Returns False if it was not waiting to be
+        started (it is running or already finished)."""
+        for idx, (_, _, _, queued) in enumerate(self._queue):
+            if queued is worker:
+                del self._queue[idx]
+                heapq.heapify(self._queue)
+                return True
+
+        return False
+
+    def clear(self) -> None:
+        """Drops every request that has not been started yet."""
+        self._queue.clear()
+
+    def cancel_running(self) -> None:
+        """Cancels every request that has been started and has not finished yet."""
+        for worker in self._running.values():
+            worker.cancel()
+
+    def _has_quota_for(self, priority: RequestPriority) -> bool:
+        return self.quota_left is None or self.quota_left > QUOTA_RESERVE[priority]
+
+    def _dispatch(self) -> None:
+        while self._queue and len(self._running) < self.max_active:
+            neg_priority, _, pool, worker = self._queue[0]
+            priority = RequestPriority(-neg_priority)
+
+            # reserves grow as priorities decrease, so nothing behind the head can run either
+            if not self._has_quota_for(priority):
+                LOGGER.info(
+                    f"Holding {len(self._queue)} request(s), {self.quota_left} left in quota."
+                )
+                self._wait_for_window()
+                return
+
+            heapq.heappop(self._queue)
+            self._start(pool, worker, priority)
+
+    def _start(self, pool: QThreadPool, worker: WeatherWorker, priority: RequestPriority) -> None:
+        self._running[worker.signals] = worker
+        if self.quota_left is not None:
+            # bulk requests are charged per location
+            self.quota_left -= len(worker.query) if worker.kind == "bulk" else 1
+
+        # connected after the caller's slots, so these run last
+        worker.signals.fetched.connect(self._handle_fetched)
+        worker.signals.api_errored.connect(self._handle_api_error)
+        worker.signals.request_errored.connect(self._handle_request_error)
+        worker.signals.parse_errored.connect(self._handle_request_error)
+        worker.signals.cancelled.connect(self._handle_cancelled)
+
+        pool.start(worker, priority)
+
+    def _wait_for_window(self) -> None:
+        if self._window_pending:
+            return
+
+        self._window_pending = True
+        QTimer.singleShot(QUOTA_WINDOW_MS, self._reset_window)
+
+    def _reset_window(self) -> None:
+        # the estimate may be outdated by now; let the next response tell
+        self._window_pending = False
+        self.quota_left = None
+        self._dispatch()
+
+    def _finish(self) -> None:
+        self._running.pop(self.sender(), None)
+        self._dispatch()
+
+    @Slot(object, int)
+    def _handle_fetched(self, _data: Any, quota_left: int) -> None:
+        self.quota_left = quota_left
+        self._finish()
+
+    @Slot(str, int)
+    def _handle_api_error(self, _message: str, code: int) -> None:
+        if code == QUOTA_EXCEEDED:
+            self.quota_left = 0
+
+        self._finish()
+
+    @Slot(str, str)
+    def _handle_request_error(self, _class_name: str, _message: str) -> None:
+        self._finish()
+
+    @Slot()
+    def _handle_cancelled(self) -> None:
+        # the quota was charged when starting, but whether the API counted the request
+        # is unknown; the next response corrects the estimate either way
+        self._finish()
+
+
+scheduler = RequestScheduler()
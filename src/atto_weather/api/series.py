@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Literal, Sequence
+
+from atto_weather.api.core import Forecast, ForecastHour, LazySequence
+
+try:
+    import numpy as np
+except ImportError:  # optional, installed with the "numpy" extra
+    np = None
+
+METRICS: dict[str, Callable[[ForecastHour], float]] = {
+    "temp_c": attrgetter("temperature.celsius"),
+    "temp_f": attrgetter("temperature.fahrenheit"),
+    "feelslike_c": attrgetter("feels_like.celsius"),
+    "feelslike_f": attrgetter("feels_like.fahrenheit"),
+    "precip_mm": attrgetter("precipitation.millimeters"),
+    "precip_in": attrgetter("precipitation.inches"),
+    "snow_cm": attrgetter("snowfall_cm"),
+    "wind_kph": attrgetter("wind_speed.kilometers_per_hour"),
+    "wind_mph": attrgetter("wind_speed.miles_per_hour"),
+    "gust_kph": attrgetter("gust_speed.kilometers_per_hour"),
+    "gust_mph": attrgetter("gust_speed.miles_per_hour"),
+    "pressure_mb": attrgetter("pressure.millibars"),
+    "humidity": attrgetter("humidity"),
+    "cloud": attrgetter("cloud_cover"),
+    "chance_of_rain": attrgetter("chance_of_rain"),
+    "chance_of_snow": attrgetter("chance_of_snow"),
+    "uv": attrgetter("uv_index"),
+    "vis_km": attrgetter("visibility.kilometers"),
+}
+"""Metrics that can be stored in a series, named after their key in the API response,
+with how to read them from a parsed :class:`ForecastHour`."""
+
+Reduction = Literal["min", "max", "mean", "sum"]
+
+
+class HourlySeries:
+    """Hourly forecasts of a location stored column by column.
+
+    Each metric is kept in a contiguous ``array('d')`` aligned with ``time_epoch``, so
+    aggregates run over flat buffers instead of :class:`ForecastHour` objects. When
+    NumPy is installed, :meth:`values` returns zero-copy NumPy views and aggregates
+    are vectorized; otherwise they fall back to plain Python loops.
+    """
+
+    def __init__(self, time_epoch: array, day_epoch: array, columns: dict[str, array]) -> None:
+        self.time_epoch = time_epoch
+        """Hour timestamps in ascending order."""
+        self.day_epoch = day_epoch
+        """Timestamp of the forecast day each hour belongs to."""
+        self.columns = columns
+
+    @classmethod
+    def from_forecasts(
+        cls, forecasts: Iterable[Forecast], metrics: Iterable[str] = METRICS
+    ) -> HourlySeries:
+        """Creates a series of ``metrics`` from the hours of each forecast.
+
+        Unparsed hours are read straight from the API response, so building a series
+        does not create :class:`ForecastHour` objects.
+        """
+        metrics = list(metrics)
+        unknown = set(metrics) - METRICS.keys()
+        if unknown:
+            raise ValueError(f"Unknown metrics: {sorted(unknown)}")
+
+        time_epoch = array("q")
+        day_epoch = array("q")
+        columns = {metric: array("d") for metric in metrics}
+
+        for forecast in forecasts:
+            hours = forecast.hours
+
+            if isinstance(hours, LazySequence):
+                rows = hours.raw
+                time_epoch.extend(row["time_epoch"] for row in rows)
+                for metric, column in columns.items():
+                    column.extend(row[metric] for row in rows)
+            else:
+                time_epoch.extend(hour.time_epoch for hour in hours)
+                for metric, column in columns.items():
+                    column.extend(map(METRICS[metric], hours))
+
+            day_epoch.extend([forecast.date_epoch] * len(hours))
+
+        return cls(time_epoch, day_epoch, columns)
+
+    def __len__(self) -> int:
+        return len(self.time_epoch)
+
+    def values(self, metric: str) -> Any:
+        """Returns the column of ``metric``, as a NumPy array if available."""
+        column = self.columns[metric]
+        if np is not None:
+            return np.frombuffer(column, dtype=np.float64)
+
+        return column
+
+    def between(self, start: int, end: int) -> HourlySeries:
+        """Returns the hours with ``start <= time_epoch <= end``."""
+        lo_idx = bisect_left(self.time_epoch, start)
+        hi_idx = bisect_right(self.time_epoch, end)
+
+        return HourlySeries(
+            self.time_epoch[lo_idx:hi_idx],
+            self.day_epoch[lo_idx:hi_idx],
+            {metric: column[lo_idx:hi_idx] for metric, column in self.columns.items()},
+        )
+
+    def min(self, metric: str) -> float:
+        """Raises ValueError if the series is empty, as do :meth:`max` and :meth:`mean`."""
+        column = self._non_empty(metric)
+        return float(np.min(self.values(metric)) if np is not None else min(column))
+
+    def max(self, metric: str) -> float:
+        column = self._non_empty(metric)
+        return float(np.max(self.values(metric)) if np is not None else max(column))
+
+    def mean(self, metric: str) -> float:
+        column = self._non_empty(metric)
+        return float(np.mean(self.values(metric)) if np is not None else sum(column) / len(column))
+
+    def _non_empty(self, metric: str) -> array:
+        # checked up front so that both backends fail the same way
+        column = self.columns[metric]
+        if not column:
+            raise ValueError(f"Cannot aggregate {metric!r} over an empty series")
+
+        return column
+
+    def rolling_mean(self, metric: str, window: int) -> Sequence[float]:
+        """Returns the mean of every ``window`` consecutive hours."""
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        if np is not None:
+            sums = np.cumsum(np.concatenate(([0.0], self.values(metric))))
+            return (sums[window:] - sums[:-window]) / window
+
+        column = self.columns[metric]
+        means = array("d")
+        total = sum(column[:window])
+        for idx in range(window, len(column) + 1):
+            means.append(total / window)
+            if idx < len(column):
+                total += column[idx] - column[idx - window]
+
+        return means
+
+    def daily(self, metric: str, reduce: Reduction) -> dict[int, float]:
+        """Reduces ``metric`` over the hours of each forecast day. Returns a mapping of
+        each day's timestamp to its value."""
+        if np is not None:
+            days = np.frombuffer(self.day_epoch, dtype=np.int64)
+            if not len(days):
+                return {}
+
+            starts = np.flatnonzero(np.diff(days, prepend=days[0] - 1))
+            values = self.values(metric)
+            if reduce == "mean":
+                reduced = np.add.reduceat(values, starts) / np.diff(starts, append=len(values))
+            else:
+                reduced = {"min": np.minimum, "max": np.maximum, "sum": np.add}[reduce].reduceat(
+                    values, starts
+                )
+
+            return dict(zip(days[starts].tolist(), reduced.tolist()))
+
+        reducers: dict[str, Callable[[list[float]], float]] = {
+            "min": min,
+            "max": max,
+            "sum": sum,
+            "mean": lambda values: sum(values) / len(values),
+        }
+
+        return {
+            day: reducers[reduce]([value for _, value in group])
+            for day, group in groupby(
+                zip(self.day_epoch, self.columns[metric]), key=lambda pair: pair[0]
+            )
+        }
+
+
+def stack(series: Sequence[HourlySeries], metric: str) -> Any:
+    """Aligns ``metric`` of several series (e.g. one per location) on their hours.
+
+    Returns a 2-D NumPy array with a row per series and a column per hour in the union
+    of their timestamps. Hours missing from a series are NaN, so aggregates across
+    locations can use ``np.nanmin``, ``np.nanmean``, etc. along axis 0.
+    """
+    if np is None:
+        raise RuntimeError("Stacking series requires NumPy (install the 'numpy' extra).")
+
+    times = np.unique(np.concatenate([np.frombuffer(s.time_epoch, dtype=np.int64) for s in series]))
+    stacked = np.full((len(series), len(times)), np.nan)
+
+    for row, item in enumerate(series):
+        positions = np.searchsorted(times, np.frombuffer(item.time_epoch, dtype=np.int64))
+        stacked[row, positions] = item.values(metric)
+
+    return stacked
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import collections.abc
+import sys
+import zlib
+from dataclasses import fields, is_dataclass
+from struct import Struct
+from struct import error as StructError
+from typing import Any, Callable, Iterator, Sequence, TypeVar, get_args, get_origin, get_type_hints
+
+from atto_weather.api.core import LazySequence, WeatherInfo
+
+ItemT = TypeVar("ItemT")
+
+MAGIC = b"ATWS"
+VERSION = 2
+
+HEADER = Struct("<4sHII")
+"""Magic, format version, checksum of the record layouts and checksum of the rest of
+the snapshot."""
+COUNT = Struct("<I")
+
+_SCALAR_CODES = {float: "d", int: "d", bool: "?", str: "I"}
+"""Numbers are stored as doubles, which keeps every integer the API sends exact, and
+strings as an index into the string table of the snapshot."""
+
+
+class SnapshotError(ValueError):
+    """Exception raised when a snapshot is malformed or was written with another layout."""
+
+
+def _as_int(value: float) -> int | float:
+    # some fields annotated as int are sent as floats (e.g. "snow_cm": 0.0)
+    return int(value) if value.is_integer() else value
+
+
+class RecordCodec:
+    """Packs and unpacks instances of a model class as fixed-size records.
+
+    Scalar fields, including those of nested models, are laid out in a single struct.
+    Fields holding a list of models follow the record as a count and the records of
+    each item. ``Sequence`` fields (e.g. :attr:`Forecast.hours`) are read lazily, so
+    their items may not contain lists themselves.
+    """
+
+    def __init__(self, cls: type) -> None:
+        if not is_dataclass(cls):
+            raise ValueError("object not dataclass")
+
+        self.cls = cls
+        self.lists: list[tuple[str, RecordCodec, bool]] = []
+
+        codes: list[str] = []
+        values: list[str] = []
+        layout: list[str] = []
+        namespace: dict[str, Any] = {"as_int": _as_int}
+
+        def add_fields(model: type, path: str) -> str:
+            # models that share their instances (e.g. Condition) are built through it
+            namespace[model.__qualname__] = getattr(model, "shared", model)
+            hints = get_type_hints(model)
+            args = []
+            layout.append(f"{model.__qualname__}(")
+
+            for field in fields(model):
+                type_ = hints[field.name]
+                expr = f"{path}.{field.name}"
+
+                if type_ in _SCALAR_CODES:
+                    idx = len(codes)
+                    codes.append(_SCALAR_CODES[type_])
+                    layout.append(f"{field.name}:{_SCALAR_CODES[type_]},")
+                    values.append(f"intern({expr})" if type_ is str else expr)
+
+                    if type_ is str:
+                        args.append(f"strings[v[{idx}]]")
+                    elif type_ is int:
+                        args.append(f"as_int(v[{idx}])")
+                    else:
+                        args.append(f"v[{idx}]")
+                elif is_dataclass(type_):
+                    layout.append(f"{field.name}:")
+                    args.append(add_fields(type_, expr))
+                elif get_origin(type_) in (list, collections.abc.Sequence) and path == "obj":
+                    (item_type,) = get_args(type_)
+                    lazy = get_origin(type_) is not list
+                    codec = RecordCodec(item_type)
+                    if lazy and codec.lists:
+                        raise ValueError(f"Items of lazy field {field.name!r} contain lists")
+
+                    args.append(f"lists[{len(self.lists)}]")
+                    self.lists.append((field.name, codec, lazy))
+                    layout.append(f"{field.name}:[{codec.layout}],")
+                else:
+                    raise ValueError(f"Cannot store field {expr!r} of type {type_!r}")
+
+            layout.append("),")
+            return f"{model.__qualname__}({', '.join(args)})"
+
+        build = add_fields(cls, "obj")
+
+        self.struct = Struct("<" + "".join(codes))
+        self.layout = "".join(layout)
+        """Names and codes of every field, in order, including those of nested models
+        and list items. Snapshots written with another layout cannot be read."""
+
+        code = (
+            f"def values(obj, intern):\n    return ({', '.join(values)},)\n"
+            f"def build(v, strings, lists):\n    return {build}\n"
+        )
+        exec(compile(code, f"<snapshot codec {cls.__qualname__}>", "exec"), namespace)
+
+        self._values: Callable[[Any, Callable[[str], int]], tuple[Any, ...]] = namespace["values"]
+        self._build: Callable[[tuple[Any, ...], list[str], list[Any]], Any] = namespace["build"]
+
+    def pack(self, obj: Any, intern: Callable[[str], int], out: bytearray) -> None:
+        out += self.struct.pack(*self._values(obj, intern))
+
+        for name, codec, _ in self.lists:
+            items = getattr(obj, name)
+            out += COUNT.pack(len(items))
+            # packing a lazy sequence must not leave every item of it parsed
+            for item in items.iter_uncached() if isinstance(items, LazySequence) else items:
+                codec.pack(item, intern, out)
+
+    def unpack(self, buf: bytes, offset: int, strings: list[str]) -> tuple[Any, int]:
+        """Returns the object stored at ``offset`` and the offset past its record."""
+        values = self.struct.unpack_from(buf, offset)
+        offset += self.struct.size
+
+        lists: list[Any] = []
+        for _, codec, lazy in self.lists:
+            (count,) = COUNT.unpack_from(buf, offset)
+            offset += COUNT.size
+
+            if lazy:
+                lists.append(SnapshotSequence(buf, offset, count, codec, strings))
+                offset += count * codec.struct.size
+                continue
+
+            items = []
+            for _ in range(count):
+                item, offset = codec.unpack(buf, offset, strings)
+                items.append(item)
+            lists.append(items)
+
+        return self._build(values, strings, lists), offset
+
+
+class SnapshotSequence(Sequence[ItemT]):
+    """Read-only sequence of the fixed-size records of a snapshot, each unpacked on
+    first access."""
+
+    __slots__ = ("_buf", "_offset", "_count", "_codec", "_strings", "_items")
+
+    def __init__(
+        self, buf: bytes, offset: int, count: int, codec: RecordCodec, strings: list[str]
+    ) -> None:
+        self._buf = buf
+        self._offset = offset
+        self._count = count
+        self._codec = codec
+        self._strings = strings
+        self._items: list[ItemT | None] = [None] * count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(self._count))]
+
+        item = self._items[index]
+        if item is None:
+            if index < 0:
+                index += self._count
+
+            offset = self._offset + index * self._codec.struct.size
+            item, _ = self._codec.unpack(self._buf, offset, self._strings)
+            self._items[index] = item
+
+        return item
+
+    def __iter__(self) -> Iterator[ItemT]:
+        for idx in range(self._count):
+            yield self[idx]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, collections.abc.Sequence):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._count} items)"
+
+
+_codec = RecordCodec(WeatherInfo)
+_layout_checksum = zlib.crc32(_codec.layout.encode())
+
+
+def dump_snapshot(info: WeatherInfo) -> bytes:
+    """Returns the binary snapshot of ``info``.
+
+    A snapshot is made of a header, a table with each distinct string (condition
+    texts, wind directions, times, the timezone, ...) and the records of ``info``,
+    which refer to the strings by index. Hours that have not been parsed yet are
+    parsed only to be packed, ``info`` keeps them unparsed.
+    """
+    table: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        idx = table.get(value)
+        if idx is None:
+            idx = table[value] = len(table)
+        return idx
+
+    records = bytearray()
+    _codec.pack(info, intern, records)
+
+    body = bytearray(COUNT.pack(len(table)))
+    for value in table:
+        encoded = value.encode("utf-8")
+        body += COUNT.pack(len(encoded))
+        body += encoded
+
+    body += records
+    return HEADER.pack(MAGIC, VERSION, _layout_checksum, zlib.crc32(body)) + body
+
+
+def load_snapshot(buf: bytes, offset: int = 0) -> WeatherInfo:
+    """Returns the :class:`WeatherInfo` stored in the snapshot at ``offset`` of ``buf``.
+
+    The hours of each forecast are unpacked on access, straight from ``buf``. Strings
+    are interned, so they are shared with other loaded snapshots.
+    """
+    try:
+        magic, version, layout_checksum, checksum = HEADER.unpack_from(buf, offset)
+    except StructError as exc:
+        raise SnapshotError("truncated snapshot") from exc
+
+    if magic != MAGIC:
+        raise SnapshotError("not a weather snapshot")
+    if version != VERSION or layout_checksum != _layout_checksum:
+        raise SnapshotError(f"snapshot written with another layout (version {version})")
+
+    offset += HEADER.size
+    # hours are unpacked later on, they must not run into corrupted data then
+    if zlib.crc32(memoryview(buf)[offset:]) != checksum:
+        raise SnapshotError("snapshot checksum mismatch")
+
+    try:
+        (count,) = COUNT.unpack_from(buf, offset)
+        offset += COUNT.size
+
+        strings = []
+        for _ in range(count):
+            (length,) = COUNT.unpack_from(buf, offset)
+            offset += COUNT.size
+            strings.append(sys.intern(str(buf[offset : offset + length], "utf-8")))
+            offset += length
+
+        info, end = _codec.unpack(buf, offset, strings)
+    except (StructError, IndexError, UnicodeDecodeError) as exc:
+        raise SnapshotError(f"malformed snapshot: {exc!r}") from exc
+
+    if end != len(buf):
+        raise SnapshotError("trailing data after snapshot")
+
+    return info
@@ -1,83 +1,411 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from json import JSONDecodeError
-from typing import Literal
+from typing import Any, Callable, Hashable, Iterator, Literal, Sequence
 
 import httpx
-from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
 
-from atto_weather._self import APP_VERSION
-
-USER_AGENT = f"aescarias/atto-weather {APP_VERSION}"
+from atto_weather.api.cache import CacheKey, response_cache
+from atto_weather.api.client import get_client
+from atto_weather.api.core import AutocompleteResult, WeatherInfo
+from atto_weather.api.decoding import decode_json
+from atto_weather.api.retry import RetryPolicy
+from atto_weather.api.scheduler import RequestPriority, scheduler
 
 LOGGER = logging.getLogger(__name__)
 
+FORECAST_DAYS = 14
+"""Max allowed, the API should take care of this according to plan."""
+
+
+class APIError(Exception):
+    """Exception raised when WeatherAPI responds with an error."""
+
+    def __init__(self, message: str, code: int) -> None:
+        super().__init__(message)
+
+        self.message = message
+        self.code = code
+
+
+class ParseError(Exception):
+    """Exception raised when a response does not have the structure of the models."""
+
+
+class RequestCancelled(Exception):
+    """Exception raised inside a worker whose request was cancelled."""
+
 
 class WeatherWorkerSignals(QObject):
     api_errored = Signal(str, int)
     request_errored = Signal(str, str)
+    parse_errored = Signal(str, str)
+    """Emitted with the class name and message of the error when a response could not
+    be parsed into models."""
     fetched = Signal(object, int)
+    """Emitted with a :class:`WeatherInfo` for forecasts, a list of
+    :class:`AutocompleteResult` for searches and a mapping of each query to its
+    :class:`WeatherInfo` for bulk requests."""
+    bulk_fetched = Signal(str, object, int)
+    """Emitted once per location of a bulk request with its :class:`WeatherInfo`,
+    before ``fetched``."""
+    retrying = Signal(int, int)
+    """Emitted with the upcoming attempt and the max attempts before a request is retried."""
+    cancelled = Signal()
+    """Emitted instead of any result when the request was cancelled while running."""
+
 
+RequestKind = Literal["forecast", "search", "bulk"]
 
-RequestKind = Literal["forecast", "search"]
+RETRY_POLICIES: dict[RequestKind, RetryPolicy] = {
+    "forecast": RetryPolicy(max_attempts=3, deadline=20.0),
+    # autocomplete results are only useful while the user is still typing
+    "search": RetryPolicy(max_attempts=2, base_delay=0.25, deadline=5.0),
+    # bulk requests are sent as POST but do not modify anything
+    "bulk": RetryPolicy(max_attempts=3, deadline=30.0, retry_unsafe=True),
+}
+
+
+def parse_search(data: list[dict[str, Any]]) -> list[AutocompleteResult]:
+    return [AutocompleteResult.from_dict(location) for location in data]
+
+
+def forecast_cache_key(query: str, lang: str) -> CacheKey:
+    """Returns the response cache key for a forecast request of ``query`` in ``lang``."""
+    return (query, FORECAST_DAYS, True, lang)
 
 
 class WeatherWorker(QRunnable):
-    """Runnable that fetches weather information from https://weatherapi.com"""
+    """Runnable that fetches weather information from https://weatherapi.com
+
+    Responses are parsed into models on the pool thread, so receivers only get objects
+    that are ready to render. Bulk requests take a sequence of forecast queries
+    instead of a single one. Each location's forecast is emitted through
+    ``bulk_fetched`` and ``fetched`` is emitted last with a mapping of every
+    successful query to its forecast.
+    """
 
-    def __init__(self, kind: RequestKind, query: str, api_key: str, lang: str) -> None:
+    def __init__(
+        self, kind: RequestKind, query: str | Sequence[str], api_key: str, lang: str
+    ) -> None:
         super().__init__()
 
         self.signals = WeatherWorkerSignals()
 
+        if kind not in ("forecast", "search", "bulk"):
+            raise ValueError(f"Invalid request kind: {kind!r}")
+
         self.kind = kind
         self.query = query
         self.api_key = api_key
         self.lang = lang
 
-    def run_forecast_request(self) -> httpx.Response:
-        return httpx.get(
-            "http://api.weatherapi.com/v1/forecast.json",
+        self._cancelled = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Asks the worker to abandon its request. Thread-safe.
+
+        A request that has not been sent yet is never sent, a pending retry is skipped
+        and a response whose body has not been read yet is discarded along with its
+        connection. Prefer :meth:`RequestRegistry.cancel`, which accounts for other
+        subscribers of the request.
+        """
+        self._cancelled.set()
+
+    @property
+    def key(self) -> Hashable:
+        """Identifies requests that would produce the same response."""
+        query = self.query if isinstance(self.query, str) else tuple(self.query)
+        return (self.kind, query, self.lang, self.api_key)
+
+    def build_forecast_request(self, client: httpx.Client) -> httpx.Request:
+        return client.build_request(
+            "GET",
+            "/forecast.json",
             params={
                 "key": self.api_key,
                 "q": self.query,
-                "days": 14,  # max allowed, api should take care of this according to plan
+                "days": FORECAST_DAYS,
                 "aqi": "yes",
                 "lang": self.lang,
             },
-            headers={"User-Agent": USER_AGENT},
         )
 
-    def run_search_request(self) -> httpx.Response:
-        return httpx.get(
-            "https://api.weatherapi.com/v1/search.json",
-            params={"key": self.api_key, "query": self.query},
-            headers={"User-Agent": USER_AGENT},
+    def build_bulk_request(self, client: httpx.Client) -> httpx.Request:
+        return client.build_request(
+            "POST",
+            "/forecast.json",
+            params={
+                "key": self.api_key,
+                "q": "bulk",
+                "days": FORECAST_DAYS,
+                "aqi": "yes",
+                "lang": self.lang,
+            },
+            json={"locations": [{"q": query, "custom_id": query} for query in self.query]},
         )
 
+    def build_search_request(self, client: httpx.Client) -> httpx.Request:
+        return client.build_request(
+            "GET", "/search.json", params={"key": self.api_key, "query": self.query}
+        )
+
+    def send_once(self, request: httpx.Request) -> httpx.Response:
+        """Sends ``request`` once, checking for cancellation before the request is sent
+        and before its body is downloaded."""
+        if self.is_cancelled:
+            raise RequestCancelled
+
+        response = get_client().send(request, stream=True)
+        try:
+            if self.is_cancelled:
+                raise RequestCancelled
+
+            response.read()
+        finally:
+            # without a read body, this drops the connection instead of reusing it
+            response.close()
+
+        return response
+
+    def send(self) -> httpx.Response:
+        """Sends the request, retrying transient failures as described by the policy
+        for this kind of request."""
+        policy = RETRY_POLICIES[self.kind]
+        client = get_client()
+        if self.kind == "forecast":
+            request = self.build_forecast_request(client)
+        elif self.kind == "search":
+            request = self.build_search_request(client)
+        else:
+            request = self.build_bulk_request(client)
+
+        method = request.method
+        started = time.monotonic()
+        attempt = 1
+
+        while True:
+            try:
+                weather_rs = self.send_once(request)
+            except httpx.TransportError as exc:
+                delay = policy.next_delay(attempt, time.monotonic() - started, method)
+                if delay is None:
+                    raise
+
+                LOGGER.warning(f"Attempt {attempt} of {self.kind} request failed: {exc!r}")
+            else:
+                if not weather_rs.is_error:
+                    return weather_rs
+
+                delay = policy.next_delay(attempt, time.monotonic() - started, method, weather_rs)
+                if delay is None:
+                    return weather_rs
+
+                LOGGER.warning(
+                    f"Attempt {attempt} of {self.kind} request failed: "
+                    f"HTTP {weather_rs.status_code}"
+                )
+
+            attempt += 1
+            self.signals.retrying.emit(attempt, policy.max_attempts)
+            if self._cancelled.wait(delay):
+                raise RequestCancelled
+
     @Slot()
     def run(self) -> None:
         try:
-            if self.kind == "forecast":
-                weather_rs = self.run_forecast_request()
-            elif self.kind == "search":
-                weather_rs = self.run_search_request()
-            else:
-                raise ValueError(f"Invalid request kind: {self.kind!r}")
-        except httpx.RequestError as exc:
+            try:
+                data, quota_left = self.fetch()
+            finally:
+                # identical requests may subscribe to this worker until it is released,
+                # so nothing can be emitted before that, whatever fetch raised
+                in_flight.release(self)
+        except RequestCancelled:
+            LOGGER.info(f"Cancelled {self.kind} request for {self.query!r}")
+            self.signals.cancelled.emit()
+            return
+        except ParseError as exc:
+            LOGGER.exception(exc)
+            cause = exc.__cause__ or exc
+            self.signals.parse_errored.emit(cause.__class__.__name__, str(cause))
+            return
+        except APIError as exc:
+            self.signals.api_errored.emit(exc.message, exc.code)
+            return
+        except (httpx.RequestError, JSONDecodeError) as exc:
             LOGGER.exception(exc)
             self.signals.request_errored.emit(exc.__class__.__name__, str(exc))
             return
+        except Exception as exc:
+            # e.g. an error response without an "error" object; a terminal signal must
+            # still be emitted, the scheduler only frees the slot of a worker on one
+            LOGGER.exception(f"Unexpected error in {self.kind} request for {self.query!r}")
+            self.signals.request_errored.emit(exc.__class__.__name__, str(exc))
+            return
 
-        if weather_rs.is_error:
-            exc = weather_rs.json()["error"]
-            self.signals.api_errored.emit(exc["message"], exc["code"])
+        if self.is_cancelled:
+            # cancelled after the response arrived, nobody is waiting for it anymore
+            self.signals.cancelled.emit()
             return
 
+        if self.kind == "bulk":
+            for query, result in data.items():
+                self.signals.bulk_fetched.emit(query, result, quota_left)
+
+        self.signals.fetched.emit(data, quota_left)
+
+    def fetch(self) -> tuple[Any, int]:
+        """Performs the request. Returns the parsed response and the quota left."""
+        weather_rs = self.send()
+
+        if weather_rs.is_error:
+            error = decode_json(weather_rs.content)["error"]
+            raise APIError(error["message"], error["code"])
+
         quota_left = int(weather_rs.headers["x-weatherapi-qpm-left"])
+        data = decode_json(weather_rs.content)
+
+        if self.kind == "search":
+            return self.parse(data, parse_search), quota_left
+        if self.kind == "bulk":
+            return self.parse(data, self.parse_bulk, quota_left), quota_left
+
+        weather = self.parse(data, WeatherInfo.from_dict)
+        # only cached once known to be parseable. The cached forecast is restored from
+        # its snapshot, so the decoded response is not kept around
+        entry = response_cache.put(forecast_cache_key(self.query, self.lang), weather, quota_left)
+
+        return entry.weather, quota_left
+
+    def parse(self, data: Any, parser: Callable[..., Any], *args: Any) -> Any:
+        """Calls ``parser`` on ``data``, raising :class:`ParseError` if ``data`` does not
+        have the expected structure."""
         try:
-            self.signals.fetched.emit(weather_rs.json(), quota_left)
-        except JSONDecodeError as exc:
-            LOGGER.exception(exc)
-            self.signals.request_errored.emit(exc.__class__.__name__, str(exc))
+            return parser(data, *args)
+        except (KeyError, IndexError, TypeError, ValueError) as exc:
+            raise ParseError(f"Unexpected {self.kind} response: {exc!r}") from exc
+
+    def parse_bulk(self, data: dict[str, Any], quota_left: int) -> dict[str, WeatherInfo]:
+        """Parses and caches every location in the bulk response ``data``.
+
+        Returns a mapping of each successful query to its forecast. Locations that
+        failed or could not be parsed are left out."""
+        results = {}
+
+        for item in data["bulk"]:
+            result = item["query"]
+            query = result.get("custom_id", result["q"])
+
+            if "error" in result:
+                LOGGER.warning(f"Bulk query {query!r} failed: {result['error']['message']}")
+                continue
+
+            try:
+                weather = WeatherInfo.from_dict(result)
+            except (KeyError, IndexError, TypeError, ValueError) as exc:
+                LOGGER.warning(f"Bulk query {query!r} could not be parsed: {exc!r}")
+                continue
+
+            entry = response_cache.put(forecast_cache_key(query, self.lang), weather, quota_left)
+            results[query] = entry.weather
+
+        return results
+
+
+class RequestRegistry:
+    """Registry of in-flight requests.
+
+    Identical requests (same kind, query, language and API key) share a single worker.
+    Callers asking for a request that is already running subscribe to the signals of
+    the running worker instead of issuing another HTTP request. The registry counts
+    these subscribers so that a request is only cancelled once nobody waits for it.
+    """
+
+    def __init__(self) -> None:
+        self._workers: dict[Hashable, WeatherWorker] = {}
+        self._subscribers: dict[Hashable, int] = {}
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def request(
+        self,
+        pool: QThreadPool,
+        kind: RequestKind,
+        query: str | Sequence[str],
+        api_key: str,
+        lang: str,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ) -> Iterator[WeatherWorker]:
+        """Yields the worker for a request so that the caller can connect its signals.
+
+        If no identical request is in flight, the worker is submitted to the scheduler
+        with ``priority`` when the ``with`` block exits, otherwise the running worker
+        is promoted to ``priority`` if needed. The registry is locked for the duration
+        of the block so the worker cannot emit before the caller is subscribed.
+        """
+        with self._lock:
+            worker = WeatherWorker(kind, query, api_key, lang)
+
+            running = self._workers.get(worker.key)
+            if running is not None:
+                self._subscribers[running.key] += 1
+                try:
+                    yield running
+                except BaseException:
+                    self._subscribers[running.key] -= 1
+                    raise
+
+                scheduler.promote(running, priority)
+                return
+
+            self._workers[worker.key] = worker
+            self._subscribers[worker.key] = 1
+            try:
+                yield worker
+            except BaseException:
+                del self._workers[worker.key]
+                del self._subscribers[worker.key]
+                raise
+
+            scheduler.submit(pool, worker, priority)
+
+    def release(self, worker: WeatherWorker) -> None:
+        """Removes ``worker`` from the registry. Called by the worker before it emits."""
+        with self._lock:
+            if self._workers.get(worker.key) is worker:
+                del self._workers[worker.key]
+                del self._subscribers[worker.key]
+
+    def cancel(self, worker: WeatherWorker) -> None:
+        """Withdraws one subscription to the request of ``worker``.
+
+        When the last subscriber withdraws, the request is dropped from the scheduler
+        if it has not started yet, otherwise the worker is cancelled. Results of a
+        worker that already finished may still be delivered, so callers should also
+        ignore signals received after cancelling. Must be called from the GUI thread.
+        """
+        with self._lock:
+            if self._workers.get(worker.key) is not worker:
+                return
+
+            self._subscribers[worker.key] -= 1
+            if self._subscribers[worker.key] > 0:
+                return
+
+            del self._workers[worker.key]
+            del self._subscribers[worker.key]
+
+        if not scheduler.discard(worker):
+            worker.cancel()
+
+
+in_flight = RequestRegistry()
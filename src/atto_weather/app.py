@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import Any
 
-from PySide6.QtCore import QThreadPool, QTimer, Slot
+from PySide6.QtCore import Qt, QThreadPool, QTimer, Slot
+from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -21,9 +21,13 @@ from PySide6.QtWidgets import (
 )
 
 from atto_weather._self import APP_NAME, APP_VERSION
-from atto_weather.api.core import Forecast, WeatherInfo
-from atto_weather.api.worker import WeatherWorker
-from atto_weather.components.common import LocationLabel
+from atto_weather.api.cache import response_cache
+from atto_weather.api.client import close_client
+from atto_weather.api.core import Astronomy, Forecast, ForecastDay, WeatherInfo
+from atto_weather.api.decoding import set_backend as set_json_backend
+from atto_weather.api.scheduler import RequestPriority, scheduler
+from atto_weather.api.worker import forecast_cache_key, in_flight
+from atto_weather.components.common import LocationLabel, prewarm_weather_icons
 from atto_weather.components.locations import LocationManager, StoredLocationModel
 from atto_weather.components.panels import (
     CurrentWeatherPanel,
@@ -32,10 +36,19 @@ from atto_weather.components.panels import (
 )
 from atto_weather.i18n import get_translation as lo
 from atto_weather.store import store
+from atto_weather.utils.settings import DEFAULT_SETTINGS
 from atto_weather.utils.text import format_api_error, format_unix_datetime
 from atto_weather.windows.settings import SettingsDialog
 
 
+def summarize_days(weather: WeatherInfo) -> list[tuple[str, ForecastDay, Astronomy]]:
+    """Returns what the panels show of each forecast day, without its hours."""
+    return [
+        (forecast.date_formatted, forecast.day, forecast.astronomy)
+        for forecast in weather.forecasts
+    ]
+
+
 class AttoWeather(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -43,6 +56,9 @@ class AttoWeather(QMainWindow):
         self.pool = QThreadPool()
         self.weather_data: WeatherInfo | None = None
 
+        response_cache.ttl = store.settings.get("cache_ttl", DEFAULT_SETTINGS["cache_ttl"])
+        set_json_backend(store.settings.get("json_backend", DEFAULT_SETTINGS["json_backend"]))
+
         self.setWindowTitle(APP_NAME)
 
         self.main_widget = QWidget()
@@ -136,6 +152,19 @@ class AttoWeather(QMainWindow):
         self.setStatusBar(self.statusbar)
 
         self.update_locations()
+        self.restore_weather()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        # drop queued requests and cancel running ones (waking any in retry backoff),
+        # then give them a moment to finish before the shared client (and its
+        # connection pool) is closed
+        scheduler.clear()
+        scheduler.cancel_running()
+        self.pool.clear()
+        self.pool.waitForDone(2000)
+        close_client()
+
+        return super().closeEvent(event)
 
     @Slot()
     def open_settings(self) -> None:
@@ -180,6 +209,21 @@ class AttoWeather(QMainWindow):
         self.fetch_status_label.setText("")
         QMessageBox.critical(self, lo("app.fetch_error_title"), f"{class_name}: {message}")
 
+    @Slot(str, str)
+    def handle_parse_error(self, class_name: str, message: str) -> None:
+        self.fetch_status_label.setText("")
+        QMessageBox.critical(
+            self,
+            lo("app.fetch_error_title"),
+            f"{lo('app.invalid_response')}\n\n{class_name}: {message}",
+        )
+
+    @Slot(int, int)
+    def handle_retry(self, attempt: int, attempts: int) -> None:
+        self.fetch_status_label.setText(
+            lo("app.status_retrying").format(attempt=attempt, attempts=attempts)
+        )
+
     @Slot()
     def update_forecast(self) -> None:
         if self.weather_data is None:
@@ -206,20 +250,18 @@ class AttoWeather(QMainWindow):
         )
         self.location_hour_select.addItems(items)
 
-    @Slot(dict)
-    def update_weather(self, weather: dict[str, Any], quota_left: int) -> None:
+    @Slot(object, int)
+    def update_weather(self, weather: WeatherInfo, quota_left: int) -> None:
         self.fetch_status_label.setText(lo("app.status_done"))
         QTimer.singleShot(1000, partial(self.fetch_status_label.setText, ""))
 
-        self.weather_data = WeatherInfo.from_dict(weather)
+        self.render_weather(weather, quota_left)
+
+    def render_weather(self, weather: WeatherInfo, quota_left: int) -> None:
+        self.weather_data = weather
         self.app_stack.setCurrentWidget(self.current_weather)
 
-        if store.settings["show_quota"]:
-            self.quota_label.setVisible(True)
-            self.quota_label.setText(lo("app.quota_left").format(quota=quota_left))
-        else:
-            self.quota_label.setVisible(False)
-            self.quota_label.setText("")
+        self.update_quota(quota_left)
 
         self.location_name_label.update_location(self.weather_data.location)
         self.location_time_label.update_time(self.weather_data.location)
@@ -236,6 +278,112 @@ class AttoWeather(QMainWindow):
             self.weather_data.current, self.weather_data.forecasts[0].astronomy
         )
 
+        # the forecast overview needs the icons of every day, load them once idle
+        QTimer.singleShot(0, partial(prewarm_weather_icons, weather))
+
+    def update_quota(self, quota_left: int) -> None:
+        if store.settings["show_quota"]:
+            self.quota_label.setVisible(True)
+            self.quota_label.setText(lo("app.quota_left").format(quota=quota_left))
+        else:
+            self.quota_label.setVisible(False)
+            self.quota_label.setText("")
+
+    def restore_weather(self) -> None:
+        """Renders the last known weather for the selected location and, if it is no
+        longer fresh, refreshes it in the background."""
+        if self.location_model.rowCount() == 0:
+            return
+
+        query, lang = self.selected_request()
+
+        cached = response_cache.get(forecast_cache_key(query, lang), allow_stale=True)
+        if cached is not None:
+            self.render_weather(cached.weather, cached.quota_left)
+
+        if store.settings.get("prefetch_locations"):
+            self.prefetch_locations()
+            return
+
+        if cached is not None and cached.is_fresh:
+            return
+
+        api_key = store.secrets["weatherapi"]
+        with in_flight.request(
+            self.pool, "forecast", query, api_key, lang, RequestPriority.BACKGROUND
+        ) as worker:
+            worker.signals.fetched.connect(partial(self.revalidate_weather, query))
+            worker.signals.api_errored.connect(self.handle_revalidation_error)
+            worker.signals.request_errored.connect(self.handle_revalidation_error)
+            worker.signals.parse_errored.connect(self.handle_revalidation_error)
+
+        self.fetch_status_label.setText(lo("app.status_refreshing"))
+
+    def prefetch_locations(self) -> None:
+        """Refreshes every stored location without fresh saved weather in a single
+        bulk request."""
+        selected, lang = self.selected_request()
+
+        queries = []
+        for location in self.location_model.locations:
+            query = f"id:{location['ident']}"
+            if response_cache.get(forecast_cache_key(query, lang)) is None:
+                queries.append(query)
+
+        if not queries:
+            return
+
+        api_key = store.secrets["weatherapi"]
+        with in_flight.request(
+            self.pool, "bulk", queries, api_key, lang, RequestPriority.PREFETCH
+        ) as worker:
+            worker.signals.bulk_fetched.connect(self.revalidate_weather)
+            worker.signals.fetched.connect(partial(self.finish_prefetch, queries))
+            worker.signals.api_errored.connect(self.handle_revalidation_error)
+            worker.signals.request_errored.connect(self.handle_revalidation_error)
+            worker.signals.parse_errored.connect(self.handle_revalidation_error)
+
+        if selected in queries:
+            self.fetch_status_label.setText(lo("app.status_refreshing"))
+
+    @Slot()
+    def finish_prefetch(
+        self, queries: list[str], results: dict[str, WeatherInfo], quota_left: int
+    ) -> None:
+        self.update_quota(quota_left)
+
+        selected, _ = self.selected_request()
+        if selected in queries and selected not in results:
+            self.handle_revalidation_error()
+
+    @Slot()
+    def revalidate_weather(self, query: str, fresh: WeatherInfo, quota_left: int) -> None:
+        # the user may have fetched another location in the meantime
+        if query != self.selected_request()[0]:
+            return
+
+        self.fetch_status_label.setText("")
+
+        # hours are left out, comparing them would unpack and keep all of them on both
+        # sides. The fresh hours are kept, they are shown once a day is selected again
+        if (
+            self.weather_data is not None
+            and fresh.current == self.weather_data.current
+            and summarize_days(fresh) == summarize_days(self.weather_data)
+        ):
+            self.weather_data = fresh
+            self.update_quota(quota_left)
+            return
+
+        self.render_weather(fresh, quota_left)
+
+    @Slot()
+    def handle_revalidation_error(self, *_qt_args) -> None:
+        # a failed background refresh is not worth a dialog, the saved data stays
+        self.fetch_status_label.setText(
+            lo("app.status_saved") if self.weather_data is not None else ""
+        )
+
     @Slot()
     def update_hour_forecast(self, forecast: Forecast, idx: int) -> None:
         if idx == 0:  # average
@@ -269,16 +417,29 @@ class AttoWeather(QMainWindow):
         self.app_stack.setCurrentWidget(self.forecast)
         self.forecast.update_details(self.weather_data.forecasts)
 
+    def selected_request(self) -> tuple[str, str]:
+        """Returns the forecast query and language for the selected location."""
+        location = self.location_model.locations[self.location_select.currentIndex()]
+        return f"id:{location['ident']}", store.settings["language"]
+
     @Slot()
     def fetch_weather(self) -> None:
-        ident = self.location_model.locations[self.location_select.currentIndex()]
+        query, lang = self.selected_request()
 
-        worker = WeatherWorker(
-            "forecast", f"id:{ident}", store.secrets["weatherapi"], store.settings["language"]
-        )
-        worker.signals.fetched.connect(self.update_weather)
-        worker.signals.api_errored.connect(self.handle_api_error)
-        worker.signals.request_errored.connect(self.handle_request_error)
+        # a fresh cached response is rendered right away, no request needed
+        if (cached := response_cache.get(forecast_cache_key(query, lang))) is not None:
+            self.update_weather(cached.weather, cached.quota_left)
+            return
 
-        self.pool.start(worker)
-        self.fetch_status_label.setText(lo("app.status_fetching_weather"))
\ No newline at end of file
+        # repeated clicks join the request already in flight, connecting uniquely
+        # keeps them from rendering (or reporting errors) more than once
+        unique = Qt.ConnectionType.UniqueConnection
+        api_key = store.secrets["weatherapi"]
+        with in_flight.request(self.pool, "forecast", query, api_key, lang) as worker:
+            worker.signals.fetched.connect(self.update_weather, unique)
+            worker.signals.api_errored.connect(self.handle_api_error, unique)
+            worker.signals.request_errored.connect(self.handle_request_error, unique)
+            worker.signals.parse_errored.connect(self.handle_parse_error, unique)
+            worker.signals.retrying.connect(self.handle_retry, unique)
+
+        self.fetch_status_label.setText(lo("app.status_fetching_weather"))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Literal, Mapping, cast
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QPixmap
+from PySide6.QtGui import QFont, QGuiApplication, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QFormLayout,
     QGridLayout,
@@ -13,11 +13,18 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from atto_weather.api.core import Location
+from atto_weather.api.core import Location, WeatherInfo
 from atto_weather.i18n import get_translation as lo
+from atto_weather.resources import get_resource
 from atto_weather.utils.fields import WeatherField
 from atto_weather.utils.text import format_unix_datetime
 
+WEATHER_ICON_SIZE = 64
+
+WEATHER_ICON_CACHE_KB = 2048
+"""Room added to the :class:`QPixmapCache` limit for weather icons. A 64x64 icon takes
+16 KB, or 64 KB at a device pixel ratio of 2."""
+
 
 class LocationLabel(QLabel):
     def __init__(self) -> None:
@@ -67,12 +74,22 @@ class WeatherFieldWidget(QWidget):
 
         self.setLayout(self.wgt_layout)
 
+        self.labels = {
+            name: cast(QLabel, self.findChild(QLabel, name + "_label")) for name in self.fields
+        }
+        self.rendered: dict[str, str] = {}
+
     def set_label(self, name: str, **values: Any) -> None:
         template = self.fields[name]["template"]
         text = lo(template["value"]) if template.get("tr") else template["value"]
+        text = text.format(**values)
+
+        # only labels whose text actually changed are touched (and relaid out)
+        if self.rendered.get(name) == text:
+            return
 
-        label = cast(QLabel, self.findChild(QLabel, name + "_label"))
-        label.setText(text.format(**values))
+        self.labels[name].setText(text)
+        self.rendered[name] = text
 
 
 class WeatherOverview(QWidget):
@@ -108,15 +125,20 @@ class WeatherOverview(QWidget):
         self.setLayout(self.wgt_layout)
         self.date_label.setVisible(self.show_date)
 
+        self.icon_key: int | None = None
+
     def update_details(
         self, temperature: str, condition: str, icon: QPixmap, date: str | None = None
     ) -> None:
-        self.icon_label.setPixmap(icon)
-        self.temp_label.setText(temperature)
-        self.condition_label.setText(condition)
+        if icon.cacheKey() != self.icon_key:
+            self.icon_label.setPixmap(icon)
+            self.icon_key = icon.cacheKey()
+
+        set_text_if_changed(self.temp_label, temperature)
+        set_text_if_changed(self.condition_label, condition)
 
         if self.show_date and date:
-            self.date_label.setText(date)
+            set_text_if_changed(self.date_label, date)
 
 
 def populate_form(layout: QFormLayout, label_map: Mapping[str, WeatherField]) -> None:
@@ -147,6 +169,12 @@ def populate_grid(layout: QGridLayout, label_map: Mapping[str, WeatherField], co
             row += 2
 
 
+def set_text_if_changed(label: QLabel, text: str) -> None:
+    """Sets the text of ``label`` unless it already displays ``text``."""
+    if label.text() != text:
+        label.setText(text)
+
+
 def create_label(
     text: str | None = None,
     *,
@@ -164,9 +192,36 @@ def create_label(
     return label
 
 
-def get_weather_icon(code: int, is_day: bool) -> QPixmap:
-    """Returns the day/night (``is_day``) weather icon associated with ``code``"""
+def reserve_icon_cache() -> None:
+    """Grows the :class:`QPixmapCache` limit to fit the weather icons on top of what Qt
+    itself caches. Must be called once, after the application is created."""
+    QPixmapCache.setCacheLimit(QPixmapCache.cacheLimit() + WEATHER_ICON_CACHE_KB)
+
+
+def get_weather_icon(code: int, is_day: bool, size: int = WEATHER_ICON_SIZE) -> QPixmap:
+    """Returns the day/night (``is_day``) weather icon associated with ``code``
+
+    Scaled icons are kept in the :class:`QPixmapCache`, so an icon is only decoded again
+    once evicted from it."""
+    ratio = QGuiApplication.instance().devicePixelRatio()  # type: ignore[union-attr]
+    key = f"weather_icon/{code}/{int(is_day)}/{size}/{ratio}"
+
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    name = f"{'day' if is_day else 'night'}_icons/{code}.png"
+    pixmap = QPixmap(get_resource(name)).scaled(round(size * ratio), round(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def prewarm_weather_icons(weather: WeatherInfo) -> None:
+    """Loads the icons for the current weather and every forecast day of ``weather``
+    into the cache."""
+    get_weather_icon(weather.current.condition.code, weather.current.is_day)
 
-    if is_day:
-        return QPixmap(f":/day_icons/{code}.png").scaled(64, 64)
-    return QPixmap(f":/night_icons/{code}.png").scaled(64, 64)
+    for forecast in weather.forecasts:
+        get_weather_icon(forecast.day.condition.code, True)
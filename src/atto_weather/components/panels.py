@@ -5,7 +5,7 @@ from typing import Literal
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QGridLayout, QListWidget, QListWidgetItem, QWidget
 
-from atto_weather.api.core import Astronomy, CurrentWeather, Forecast
+from atto_weather.api.core import Astronomy, CurrentWeather, Forecast, ForecastDay, ForecastHour
 from atto_weather.components.common import WeatherOverview, get_weather_icon
 from atto_weather.components.current import AirQualityWidget, CurrentWeatherWidget
 from atto_weather.components.forecast import (
@@ -13,7 +13,7 @@ from atto_weather.components.forecast import (
     DailyForecastWidget,
     HourlyForecastWidget,
 )
-from atto_weather.utils.text import format_iso8601, format_temperature
+from atto_weather.utils.text import format_iso8601, format_settings, format_temperature
 
 
 class CurrentWeatherPanel(QWidget):
@@ -39,16 +39,32 @@ class CurrentWeatherPanel(QWidget):
 
         self.setLayout(self.grid)
 
+        self.settings = format_settings()
+        self.current: CurrentWeather | None = None
+        self.astronomy: Astronomy | None = None
+
     def update_details(self, current: CurrentWeather, astronomy: Astronomy) -> None:
-        self.overview_wgt.update_details(
-            format_temperature(current.temperature),
-            current.condition.text,
-            get_weather_icon(current.condition.code, current.is_day),
-        )
+        if (settings := format_settings()) != self.settings:
+            self.settings, self.current, self.astronomy = settings, None, None
+
+        # sections whose data is the same as last time are left untouched
+        if current != self.current:
+            self.overview_wgt.update_details(
+                format_temperature(current.temperature),
+                current.condition.text,
+                get_weather_icon(current.condition.code, current.is_day),
+            )
+
+            self.weather_wgt.update_details(current)
+
+            if self.current is None or current.air_quality != self.current.air_quality:
+                self.air_quality_group.update_details(current.air_quality)
 
-        self.weather_wgt.update_details(current)
-        self.air_quality_group.update_details(current.air_quality)
-        self.astronomy_group.update_details(astronomy)
+            self.current = current
+
+        if astronomy != self.astronomy:
+            self.astronomy_group.update_details(astronomy)
+            self.astronomy = astronomy
 
 
 class ForecastOverviewPanel(QListWidget):
@@ -59,7 +75,18 @@ class ForecastOverviewPanel(QListWidget):
 
         self.setStyleSheet("QListWidget { border: none; }")
 
+        self.settings = format_settings()
+        self.days: list[tuple[str, ForecastDay]] | None = None
+
     def update_details(self, forecasts: list[Forecast]) -> None:
+        # rebuilding the rows is only needed when the days shown (or units) changed,
+        # comparing whole forecasts would also compare (and parse) all of their hours
+        settings = format_settings()
+        days = [(forecast.date_formatted, forecast.day) for forecast in forecasts]
+        if days == self.days and settings == self.settings:
+            return
+
+        self.settings, self.days = settings, days
         self.clear()
 
         for date in forecasts:
@@ -104,24 +131,47 @@ class TimeForecastPanel(QWidget):
 
         self.setLayout(self.grid)
 
+        self.settings = format_settings()
+        self.shown: ForecastDay | ForecastHour | None = None
+        self.astronomy: Astronomy | None = None
+
     def update_hourly_details(self, forecast: Forecast, hour_index: int) -> None:
+        self.check_settings()
         hour = forecast.hours[hour_index]
 
-        self.overview_wgt.update_details(
-            format_temperature(hour.temperature),
-            hour.condition.text,
-            get_weather_icon(hour.condition.code, True),
-        )
+        if hour != self.shown:
+            self.overview_wgt.update_details(
+                format_temperature(hour.temperature),
+                hour.condition.text,
+                get_weather_icon(hour.condition.code, True),
+            )
 
-        self.forecast_wgt.update_details(hour)  # type: ignore
-        self.astronomy_wgt.update_details(forecast.astronomy)
+            self.forecast_wgt.update_details(hour)  # type: ignore
+            self.shown = hour
+
+        self.update_astronomy(forecast.astronomy)
 
     def update_daily_details(self, forecast: Forecast) -> None:
-        self.overview_wgt.update_details(
-            format_temperature(forecast.day.avg_temperature),
-            forecast.day.condition.text,
-            get_weather_icon(forecast.day.condition.code, True),
-        )
-
-        self.forecast_wgt.update_details(forecast.day)  # type: ignore
-        self.astronomy_wgt.update_details(forecast.astronomy)
+        self.check_settings()
+
+        if forecast.day != self.shown:
+            self.overview_wgt.update_details(
+                format_temperature(forecast.day.avg_temperature),
+                forecast.day.condition.text,
+                get_weather_icon(forecast.day.condition.code, True),
+            )
+
+            self.forecast_wgt.update_details(forecast.day)  # type: ignore
+            self.shown = forecast.day
+
+        self.update_astronomy(forecast.astronomy)
+
+    def check_settings(self) -> None:
+        """Forgets what is displayed if the units or language changed since."""
+        if (settings := format_settings()) != self.settings:
+            self.settings, self.shown, self.astronomy = settings, None, None
+
+    def update_astronomy(self, astronomy: Astronomy) -> None:
+        if astronomy != self.astronomy:
+            self.astronomy_wgt.update_details(astronomy)
+            self.astronomy = astronomy
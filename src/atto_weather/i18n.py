@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import logging
+import marshal
+import os
 from pathlib import Path
-from typing import Any, TypedDict
-
-import tomli
+from types import MappingProxyType
+from typing import Any, Mapping, TypedDict
 
 LOGGER = logging.getLogger(__name__)
 
 LANG_PATH = Path.cwd() / "languages"
+COMPILED_LANG_PATH = Path("cache") / "languages"
+"""Where compiled catalogs are kept, in the cache directory next to the settings (see
+:data:`atto_weather.store.CACHE_DIR`, which cannot be imported here)."""
+
+COMPILED_FORMAT = 1
 
 
 class InstalledLanguages(TypedDict):
-    main: dict[str, Any] | None
-    fallback: dict[str, Any] | None
+    main: dict[str, str] | None
+    """The catalog of the requested language, see :func:`load_catalog`."""
+    fallback: dict[str, str] | None
 
 
 class LanguageError(Exception):
@@ -24,9 +31,21 @@ class LanguageError(Exception):
 
 installed_languages = InstalledLanguages(main=None, fallback=None)
 
+_catalog: dict[str, str] = {}
+"""Flat map of every identifier to its string in the installed language, or in the
+fallback if not translated. Replaced as a whole by :func:`set_language`."""
+
+_language_index: dict[str, tuple[int, str]] = {}
+"""Name of each language file by code, along with the mtime it was read at."""
+
+missing_translations: set[str] = set()
+"""Identifiers requested since the language was set that neither language provides."""
+
 
 def load_language(lang: str) -> dict[str, Any]:
     """Loads a language file with code ``lang`` into memory."""
+    # only needed when a catalog has to be compiled, not worth importing at startup
+    import tomli
 
     lang_file = LANG_PATH / f"{lang}.toml"
     lang_data = lang_file.read_text("utf-8-sig")
@@ -35,21 +54,79 @@ def load_language(lang: str) -> dict[str, Any]:
 
 
 def get_language_map() -> dict[str, str]:
-    """Returns a map of all available language codes to their respective names"""
+    """Returns a map of all available language codes to their respective names
+
+    Only language files added or modified since the last call are read."""
     languages = {}
 
-    for code in LANG_PATH.glob("*.toml"):
-        locale = tomli.loads(code.read_text("utf-8-sig"))
+    for path in LANG_PATH.glob("*.toml"):
+        mtime = path.stat().st_mtime_ns
+
+        indexed = _language_index.get(path.stem)
+        if indexed is None or indexed[0] != mtime:
+            name = load_catalog(path.stem)["self.language"]
+            indexed = _language_index[path.stem] = (mtime, name)
 
-        languages[code.stem] = locale["self"]["language"]
+        languages[path.stem] = indexed[1]
 
     return languages
 
 
+def flatten_language(data: dict[str, Any], prefix: str = "") -> dict[str, str]:
+    """Returns the strings of the language ``data`` keyed by their dotted identifier."""
+    flat = {}
+
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten_language(value, f"{prefix}{key}."))
+        else:
+            flat[prefix + key] = value
+
+    return flat
+
+
+def load_catalog(lang: str) -> dict[str, str]:
+    """Returns the strings of language ``lang`` keyed by their dotted identifier.
+
+    The language file is compiled into a marshalled catalog on first use. The catalog
+    is read instead of the TOML file for as long as the file keeps the same mtime and
+    size.
+    """
+    lang_file = LANG_PATH / f"{lang}.toml"
+    compiled_file = COMPILED_LANG_PATH / f"{lang}.bin"
+
+    stat = lang_file.stat()
+    source = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        compiled = marshal.loads(compiled_file.read_bytes())
+        if compiled["format"] == COMPILED_FORMAT and compiled["source"] == source:
+            return compiled["strings"]
+    except FileNotFoundError:
+        pass
+    except (EOFError, ValueError, TypeError, KeyError) as exc:
+        LOGGER.warning(f"Discarding unreadable compiled catalog for lang {lang!r}: {exc!r}")
+
+    strings = flatten_language(load_language(lang))
+    compiled = {"format": COMPILED_FORMAT, "source": source, "strings": strings}
+
+    temp_file = compiled_file.with_suffix(".tmp")
+    try:
+        COMPILED_LANG_PATH.mkdir(parents=True, exist_ok=True)
+        temp_file.write_bytes(marshal.dumps(compiled))
+        os.replace(temp_file, compiled_file)
+    except OSError as exc:
+        LOGGER.warning(f"Could not write compiled catalog for lang {lang!r}: {exc}")
+
+    return strings
+
+
 def set_language(main: str, fallback: str = "en") -> None:
     """Installs language ``main`` with a ``fallback`` for use with the localizer."""
+    global _catalog
+
     try:
-        installed_languages["main"] = load_language(main)
+        installed_languages["main"] = load_catalog(main)
     except FileNotFoundError:
         LOGGER.warning(
             f"Requested language {main!r} is not available. Falling back to {fallback!r}"
@@ -57,42 +134,46 @@ def set_language(main: str, fallback: str = "en") -> None:
         installed_languages["main"] = None
 
     try:
-        installed_languages["fallback"] = load_language(fallback)
+        installed_languages["fallback"] = load_catalog(fallback)
     except FileNotFoundError:
         raise LanguageError("No fallback language available.")
 
+    catalog = dict(installed_languages["fallback"])
+    translated = installed_languages["main"] or {}
 
-def get_translation(identifier: str) -> str:
-    """Returns the localized value of ``identifier`` (or its fallback if not available)"""
+    untranslated = catalog.keys() - translated.keys()
+    if installed_languages["main"] is not None and untranslated:
+        LOGGER.warning(
+            f"{len(untranslated)} strings have no translation in lang {main!r}. "
+            f"Falling back to {fallback!r} for: {', '.join(sorted(untranslated))}"
+        )
 
-    main_i18n = installed_languages["main"]
-    if main_i18n is None:
-        main_i18n = {}
-        LOGGER.warning("No language installed. Using fallback.")
+    catalog.update(translated)
 
-    fallback = installed_languages["fallback"]
-    if fallback is None:
-        raise LanguageError("No fallback language available.")
+    _catalog = catalog
+    missing_translations.clear()
 
-    main_name = main_i18n["self"]["language"]
-    fb_name = fallback["self"]["language"]
 
-    for part in identifier.split("."):
-        main_i18n = main_i18n.get(part)  # pyright: ignore[reportOptionalMemberAccess]
-        fallback = fallback.get(part)  # pyright: ignore[reportOptionalMemberAccess]
+def get_catalog() -> Mapping[str, str]:
+    """Returns a read-only view of the strings of the installed language."""
+    return MappingProxyType(_catalog)
 
-        if main_i18n is None:
-            LOGGER.warning(
-                f"No translation available for string {identifier!r} in lang {main_name!r}. "
-                f"Falling back to {fb_name}."
-            )
 
-            main_i18n = fallback
-            if fallback is None:
-                LOGGER.error(
-                    f"Unable to provide translation for string {identifier!r}. "
-                    "Will use empty string!"
-                )
-                return ""
+def get_translation(identifier: str) -> str:
+    """Returns the localized value of ``identifier`` (or its fallback if not available)"""
+    try:
+        return _catalog[identifier]
+    except KeyError:
+        pass
+
+    if installed_languages["fallback"] is None:
+        raise LanguageError("No fallback language available.")
+
+    # reported once, this may be called for every label of every refresh
+    if identifier not in missing_translations:
+        missing_translations.add(identifier)
+        LOGGER.error(
+            f"Unable to provide translation for string {identifier!r}. Will use empty string!"
+        )
 
-    return main_i18n  # pyright: ignore[reportReturnType]
+    return ""
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Literal
+from xml.etree import ElementTree
+
+from PySide6.QtCore import QResource
+
+LOGGER = logging.getLogger(__name__)
+
+ICONS_PATH = Path.cwd() / "icons"
+ICONS_QRC = ICONS_PATH / "icons.qrc"
+ICONS_RCC = ICONS_PATH / "icons.rcc"
+"""Binary resource file, built with ``pyside6-rcc --binary icons/icons.qrc -o icons/icons.rcc``."""
+
+ResourceSource = Literal["rcc", "files", "module"]
+
+source: ResourceSource | None = None
+"""Where the resources were loaded from, see :func:`load_resources`."""
+
+_files: dict[str, str] = {}
+"""Path of the file behind each resource, when loaded from ``"files"``."""
+
+
+def load_resources() -> ResourceSource:
+    """Makes the app resources available to :func:`get_resource`.
+
+    Uses the first of these that is available:
+
+    - ``"rcc"``: the binary resource file :data:`ICONS_RCC`, which Qt maps into memory.
+    - ``"files"``: the icons themselves, read from disk as they are requested, found
+      through the aliases in :data:`ICONS_QRC`.
+    - ``"module"``: the generated ``icons_rc`` module, which holds every icon and is
+      much slower to import.
+
+    Returns the source in use.
+    """
+    global source
+
+    if ICONS_RCC.exists() and QResource.registerResource(str(ICONS_RCC)):
+        source = "rcc"
+        return source
+
+    try:
+        tree = ElementTree.parse(ICONS_QRC)
+    except (OSError, ElementTree.ParseError) as exc:
+        LOGGER.info(f"Icons not available as files, importing resource module: {exc}")
+
+        from atto_weather import icons_rc  # noqa: F401 -- registers the resources
+
+        source = "module"
+        return source
+
+    for resource in tree.getroot().iter("qresource"):
+        prefix = resource.get("prefix", "").strip("/")
+
+        for file in resource.iter("file"):
+            path = file.text.replace("\\", "/")  # type: ignore[union-attr]
+            alias = file.get("alias", path)
+            _files[f"{prefix}/{alias}"] = str(ICONS_PATH / path)
+
+    source = "files"
+    return source
+
+
+def get_resource(name: str) -> str:
+    """Returns the path Qt should load the resource ``name`` (e.g. ``"app/app_icon.png"``,
+    as declared in ``icons.qrc``) from."""
+    return _files.get(name) or f":/{name}"
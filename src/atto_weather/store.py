@@ -7,6 +7,9 @@ from atto_weather.utils.settings import Secrets, Settings
 
 SETTINGS_FILE = Path("settings.json")
 SECRETS_FILE = Path("secrets.json")
+CACHE_DIR = Path("cache")
+GAZETTEER_FILE = Path("gazetteer.json")
+"""Optional list of ``search.json`` results used to search locations offline."""
 
 
 class Store:
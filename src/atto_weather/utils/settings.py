@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal, TypeAlias, TypedDict
+from typing import Callable, Literal, TypeAlias, TypedDict, Union
 
 from typing_extensions import NotRequired
 
@@ -17,6 +17,9 @@ class Settings(TypedDict):
     round_temp_values: bool
     show_quota: bool
     time_24_hour: bool
+    cache_ttl: int
+    prefetch_locations: bool
+    json_backend: Literal["auto", "orjson", "msgspec", "json"]
 
 
 class StoredLocation(TypedDict):
@@ -38,6 +41,9 @@ DEFAULT_SETTINGS = Settings(
     round_temp_values=True,
     show_quota=False,
     time_24_hour=False,
+    cache_ttl=900,
+    prefetch_locations=False,
+    json_backend="auto",
 )
 
 DEFAULT_SECRETS = Secrets(weatherapi="")
@@ -51,8 +57,9 @@ class BaseUISetting(TypedDict):
 class SelectUISetting(BaseUISetting):
     kind: Literal["select"]
 
-    options: dict[str, str]
-    """A mapping of option values to their localizable string identifier."""
+    options: Union[dict[str, str], Callable[[], dict[str, str]]]
+    """A mapping of option values to their localizable string identifier, or a function
+    returning it when the options are only known once the field is displayed."""
 
     options_preloc: NotRequired[bool]
     """Whether the options have been already localized."""
@@ -72,7 +79,7 @@ SETTINGS_FIELDS: dict[str, UISetting] = {
     "language": {
         "label": "settings.language",
         "kind": "select",
-        "options": get_language_map(),
+        "options": get_language_map,
         "options_preloc": True,
     },
     "temperature": {
@@ -110,8 +117,15 @@ SETTINGS_FIELDS: dict[str, UISetting] = {
     "round_temp_values": {"label": "settings.round_temp_values", "kind": "check"},
     "show_quota": {"label": "settings.show_remaining_quota", "kind": "check"},
     "time_24_hour": {"label": "settings.time_24_hour", "kind": "check"},
+    "prefetch_locations": {"label": "settings.prefetch_locations", "kind": "check"},
 }
 
 SECRETS_FIELDS: dict[str, UISetting] = {
     "weatherapi": {"label": "settings.weather_api_key", "kind": "password"}
 }
+
+
+def get_options(select: SelectUISetting) -> dict[str, str]:
+    """Returns the options of ``select``, loading them first if needed."""
+    options = select["options"]
+    return options() if callable(options) else options
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 
 from PySide6.QtCore import QDateTime, QLocale, Qt, QTimeZone
 
@@ -8,6 +8,21 @@ from atto_weather.api.core import Distance, Height, Pressure, Speed, Temperature
 from atto_weather.i18n import get_translation as lo
 from atto_weather.store import store
 
+FORMAT_SETTINGS = (
+    "temperature",
+    "round_temp_values",
+    "distance",
+    "height",
+    "pressure",
+    "language",
+    "time_24_hour",
+)
+
+
+def format_settings() -> tuple[Any, ...]:
+    """Returns the current value of every setting that affects the ``format_*`` output."""
+    return tuple(store.settings.get(key) for key in FORMAT_SETTINGS)
+
 
 def format_temperature(temp: Temperature) -> str:
     if store.settings["temperature"] == "fahrenheit":
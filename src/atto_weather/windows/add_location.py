@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 from PySide6.QtCore import (
@@ -23,8 +24,15 @@ from PySide6.QtWidgets import (
 )
 from typing_extensions import TypeAlias
 
+from atto_weather.api.cache import autocomplete_cache
 from atto_weather.api.core import AutocompleteResult
-from atto_weather.api.worker import WeatherWorker
+from atto_weather.api.gazetteer import (
+    Gazetteer,
+    GazetteerLoader,
+    get_gazetteer,
+    is_gazetteer_loaded,
+)
+from atto_weather.api.worker import WeatherWorker, in_flight
 from atto_weather.i18n import get_translation as lo
 from atto_weather.store import store, write_settings
 from atto_weather.utils.settings import StoredLocation
@@ -55,6 +63,14 @@ class AddLocationDialog(QDialog):
 
         self.pool = QThreadPool.globalInstance()
 
+        self.search_generation = 0
+        """Incremented for each search. Results carrying an older generation are stale."""
+        self.search_worker: WeatherWorker | None = None
+
+        self.gazetteer: Gazetteer | None = None
+        self.local_results: list[AutocompleteResult] = []
+        """Gazetteer results for the current text, shown until remote results arrive."""
+
         self.setWindowTitle(lo("dialogs.add_location.title"))
 
         self.main_layout = QVBoxLayout()
@@ -92,9 +108,55 @@ class AddLocationDialog(QDialog):
 
         self.setLayout(self.main_layout)
 
+        # usually loaded at startup, reading a large one here would freeze the dialog
+        if is_gazetteer_loaded():
+            self.gazetteer = get_gazetteer()
+        else:
+            loader = GazetteerLoader()
+            loader.signals.loaded.connect(self.set_gazetteer)
+            self.pool.start(loader)
+
+    @Slot(object)
+    def set_gazetteer(self, gazetteer: Gazetteer | None) -> None:
+        self.gazetteer = gazetteer
+
+        # the user may have typed something while it was loading
+        text = self.location_search_edit.text().strip()
+        if gazetteer is None or not text:
+            return
+
+        self.local_results = gazetteer.search(text)
+        if self.local_results:
+            self.location_status_label.setHidden(False)
+            self.show_results(self.merge_results(autocomplete_cache.get(text) or []))
+
     def start_debounce(self) -> None:
+        # whatever is being searched no longer matches the text
+        self.cancel_search()
+
+        text = self.location_search_edit.text().strip()
+        self.local_results = self.gazetteer.search(text) if self.gazetteer and text else []
+        if self.local_results:
+            self.location_status_label.setHidden(False)
+            self.show_results(self.local_results)
+        else:
+            self.location_status_label.setHidden(True)
+
         self.debounce_timer.start()
-        self.location_status_label.setHidden(True)
+
+    def cancel_search(self) -> None:
+        """Cancels the current search, if any, and invalidates its results."""
+        self.search_generation += 1
+
+        if self.search_worker is not None:
+            in_flight.cancel(self.search_worker)
+            self.search_worker = None
+
+    def done(self, result: int) -> None:
+        self.debounce_timer.stop()
+        self.cancel_search()
+
+        super().done(result)
 
     def handle_selection(self) -> None:
         self.add_location_button.setDisabled(False)
@@ -120,24 +182,59 @@ class AddLocationDialog(QDialog):
         if not text:
             return
 
-        worker = WeatherWorker(
-            "search", text, store.secrets["weatherapi"], store.settings["language"]
-        )
-
+        self.cancel_search()
         self.location_status_label.setHidden(False)
-        self.location_status_label.setText(lo("dialogs.add_location.searching"))
 
-        worker.signals.fetched.connect(self.handle_success)
-        worker.signals.api_errored.connect(self.handle_api_failure)
-        worker.signals.request_errored.connect(self.handle_request_failure)
+        cached = autocomplete_cache.get(text)
+        if cached is not None:
+            self.show_results(self.merge_results(cached))
+            return
+
+        # remote search only enriches local results, which stay up meanwhile
+        if not self.local_results:
+            self.location_status_label.setText(lo("dialogs.add_location.searching"))
 
-        self.pool.tryStart(worker)
+        generation = self.search_generation
 
-    @Slot(object)
-    def handle_success(self, locations: list[dict[str, Any]]) -> None:
-        self.location_results_model.locations = [
-            AutocompleteResult.from_dict(location) for location in locations
+        api_key, lang = store.secrets["weatherapi"], store.settings["language"]
+        with in_flight.request(self.pool, "search", text, api_key, lang) as worker:
+            worker.signals.fetched.connect(partial(self.handle_success, generation, text))
+            worker.signals.api_errored.connect(partial(self.handle_api_failure, generation))
+            worker.signals.request_errored.connect(partial(self.handle_request_failure, generation))
+            worker.signals.parse_errored.connect(partial(self.handle_request_failure, generation))
+            worker.signals.retrying.connect(partial(self.handle_retry, generation))
+
+        self.search_worker = worker
+
+    def is_current_search(self, generation: int) -> bool:
+        """Returns whether ``generation`` is the current search, ending it if so."""
+        if generation != self.search_generation:
+            return False
+
+        self.search_worker = None
+        return True
+
+    def handle_success(
+        self, generation: int, query: str, results: list[AutocompleteResult], _quota: int
+    ) -> None:
+        # still worth keeping if superseded, the user may backspace to this query
+        autocomplete_cache.put(query, results)
+
+        if self.is_current_search(generation):
+            self.show_results(self.merge_results(results))
+
+    def merge_results(self, remote: list[AutocompleteResult]) -> list[AutocompleteResult]:
+        """Returns the local results followed by the ``remote`` ones not among them."""
+        if not self.local_results:
+            return remote
+
+        local_idents = {result.ident for result in self.local_results}
+        return self.local_results + [
+            result for result in remote if result.ident not in local_idents
         ]
+
+    def show_results(self, locations: list[AutocompleteResult]) -> None:
+        self.location_results_model.locations = locations
         self.location_results_model.layoutChanged.emit()
 
         if len(locations) == 0:
@@ -149,14 +246,34 @@ class AddLocationDialog(QDialog):
 
         self.location_status_label.setText(text)
 
-    @Slot(str, int)
-    def handle_api_failure(self, message: str, code: int) -> None:
+    def handle_retry(self, generation: int, attempt: int, attempts: int) -> None:
+        if generation != self.search_generation:
+            return
+
+        self.location_status_label.setText(
+            lo("app.status_retrying").format(attempt=attempt, attempts=attempts)
+        )
+
+    def handle_api_failure(self, generation: int, message: str, code: int) -> None:
+        if not self.is_current_search(generation):
+            return
+
+        if self.local_results:
+            self.show_results(self.local_results)
+            return
+
         self.location_status_label.setHidden(False)
         self.location_status_label.setText(
             lo("dialogs.add_location.error").format(message=message, code=code)
         )
 
-    @Slot(str, str)
-    def handle_request_failure(self, class_name: str, message: str) -> None:
+    def handle_request_failure(self, generation: int, class_name: str, message: str) -> None:
+        if not self.is_current_search(generation):
+            return
+
+        if self.local_results:
+            self.show_results(self.local_results)
+            return
+
         self.location_status_label.setHidden(False)
         self.location_status_label.setText(f"{class_name}: {message}")
@@ -23,6 +23,7 @@ from PySide6.QtWidgets import (
 
 from atto_weather._self import APP_COPYRIGHT, APP_NAME, APP_VERSION
 from atto_weather.i18n import get_translation as lo
+from atto_weather.resources import get_resource
 from atto_weather.store import store, write_secrets, write_settings
 from atto_weather.utils.settings import (
     DEFAULT_SECRETS,
@@ -30,6 +31,7 @@ from atto_weather.utils.settings import (
     SECRETS_FIELDS,
     SETTINGS_FIELDS,
     SelectUISetting,
+    get_options,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -78,7 +80,7 @@ class AboutTab(QWidget):
         self.vbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.image_label = QLabel()
-        self.image_label.setPixmap(QPixmap(":/app/app_icon.png").scaled(64, 64))
+        self.image_label.setPixmap(QPixmap(get_resource("app/app_icon.png")).scaled(64, 64))
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.app_name_label = QLabel(APP_NAME)
@@ -123,24 +125,25 @@ class GeneralTab(QWidget):
             if field["kind"] == "select":
                 assert isinstance(value, str)
 
+                options = get_options(field)
                 combobox = QComboBox()
-                config_name = field["options"].get(value)
+                config_name = options.get(value)
 
                 if config_name is None:
                     # invalid config value, set defaults
                     default = DEFAULT_SETTINGS[setting]
                     store.settings[setting] = default
-                    config_name = field["options"][default]
+                    config_name = options[default]
 
                     LOGGER.warning(
                         f"Invalid value set for {config_name!r}. Set to default {default!r}."
                     )
 
                 if field.get("options_preloc", False):
-                    combobox.addItems(list(field["options"].values()))
+                    combobox.addItems(list(options.values()))
                     combobox.setCurrentText(config_name)
                 else:
-                    combobox.addItems(list(map(lo, field["options"].values())))
+                    combobox.addItems(list(map(lo, options.values())))
                     combobox.setCurrentText(lo(config_name))
 
                 combobox.currentIndexChanged.connect(
@@ -185,11 +188,12 @@ class GeneralTab(QWidget):
     @Slot()
     def update_combobox(self, combo: QComboBox, setting: str, *_qt_args) -> None:
         select = cast(SelectUISetting, SETTINGS_FIELDS[setting])
+        options = get_options(select)
 
         if select.get("options_preloc", False):
-            labels_to_values = {v: k for k, v in select["options"].items()}
+            labels_to_values = {v: k for k, v in options.items()}
         else:
-            labels_to_values = {lo(v): k for k, v in select["options"].items()}
+            labels_to_values = {lo(v): k for k, v in options.items()}
 
         store.settings[setting] = labels_to_values[combo.currentText()]
 
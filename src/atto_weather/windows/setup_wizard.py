@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from enum import IntEnum
-from typing import Any
 
 from PySide6.QtCore import Qt, QThreadPool, QTimer, Slot
 from PySide6.QtGui import QKeyEvent
@@ -20,7 +19,7 @@ from PySide6.QtWidgets import (
 
 from atto_weather._self import APP_NAME
 from atto_weather.api.core import AutocompleteResult
-from atto_weather.api.worker import WeatherWorker
+from atto_weather.api.worker import in_flight
 from atto_weather.components.locations import LocationManager
 from atto_weather.i18n import get_language_map, set_language
 from atto_weather.i18n import get_translation as lo
@@ -152,13 +151,13 @@ class APISetupPage(QWizardPage):
         self.wizard().button(QWizard.WizardButton.NextButton).setDisabled(True)
         self.status_label.setText(lo("wizard.api_setup.status_validating"))
 
-        worker = WeatherWorker("forecast", "auto:ip", self.field("apikey"), "en")
-
-        worker.signals.fetched.connect(self.handle_valid_key)
-        worker.signals.api_errored.connect(self.handle_invalid_key)
-        worker.signals.request_errored.connect(self.handle_request_error)
-
-        self.pool.tryStart(worker)
+        unique = Qt.ConnectionType.UniqueConnection
+        api_key = self.field("apikey")
+        with in_flight.request(self.pool, "forecast", "auto:ip", api_key, "en") as worker:
+            worker.signals.fetched.connect(self.handle_valid_key, unique)
+            worker.signals.api_errored.connect(self.handle_invalid_key, unique)
+            worker.signals.request_errored.connect(self.handle_request_error, unique)
+            worker.signals.parse_errored.connect(self.handle_request_error, unique)
 
     @Slot()
     def handle_valid_key(self) -> None:
@@ -267,19 +266,19 @@ class LocationPromptPage(QWizardPage):
         self.wizard().button(QWizard.WizardButton.NextButton).setDisabled(True)
         self.status_label.setText(lo("wizard.location_prompt.status_adding"))
 
-        worker = WeatherWorker("search", "auto:ip", store.secrets["weatherapi"], "en")
-
-        worker.signals.fetched.connect(self.handle_success)
-        worker.signals.api_errored.connect(self.handle_api_failure)
-        worker.signals.request_errored.connect(self.handle_request_failure)
-
-        self.pool.tryStart(worker)
+        unique = Qt.ConnectionType.UniqueConnection
+        api_key = store.secrets["weatherapi"]
+        with in_flight.request(self.pool, "search", "auto:ip", api_key, "en") as worker:
+            worker.signals.fetched.connect(self.handle_success, unique)
+            worker.signals.api_errored.connect(self.handle_api_failure, unique)
+            worker.signals.request_errored.connect(self.handle_request_failure, unique)
+            worker.signals.parse_errored.connect(self.handle_request_failure, unique)
 
     @Slot(object)
-    def handle_success(self, results: list[dict[str, Any]]) -> None:
+    def handle_success(self, results: list[AutocompleteResult]) -> None:
         self.status_label.setText(lo("wizard.location_prompt.status_success"))
 
-        autocomplete = AutocompleteResult.from_dict(results[0])
+        autocomplete = results[0]
 
         location = StoredLocation(name=autocomplete.full_name, ident=autocomplete.ident)
 